@@ -68,6 +68,26 @@ class Defaults:
     VOTE_DELAY_MS = 500
     RESIZE_DEBOUNCE_MS = 300
     PRELOAD_DELAY_MS = 100
+    STATS_REFRESH_DELAY_MS = 200
+    LOAD_POLL_MS = 40
+    TRANSIENT_STATUS_MS = 3000  # How long a keyboard save's confirmation stays in the status bar
+    VOTING_TREE_DELAY_MS = 50  # Voting area is built after the top bar has painted
+    WINDOW_PREWARM_DELAY_MS = 1500  # Stats/settings modules are imported once startup settles
+    
+    # Hover previews in the stats window
+    PREVIEW_CACHE_SIZE = 32  # Resized previews kept for re-hovering
+    PREVIEW_SIZE_STEP = 16  # Preview sizes are rounded down to this, so small resizes hit the cache
+    PREVIEW_HOVER_DELAY_MS = 120  # Hover must settle this long before a preview is loaded
+    
+    # %-style so the per-vote update is a single tuple format
+    STATS_LABEL_FORMAT = "Votes: %d | Active: %d | Binned: %d"
+    CUTLINE_STATS_LABEL_FORMAT = (
+        "Votes: %d  |  ✓ In: %d  ~ Boundary: %d  ✗ Out: %d  Binned: %d  |  "
+        "Cutline: %s (target %d)  |  Resolution: %.0f%%"
+    )
+    
+    # Background metadata extraction threads (I/O bound: ~8-16 on SSDs, 2-4 on HDDs)
+    METADATA_WORKERS = 8
     
     SUPPORTED_IMAGE_EXTENSIONS = (
         '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'
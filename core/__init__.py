@@ -1,17 +1,29 @@
 """Core business logic modules for the Image Ranking System."""
 
-from .data_manager import DataManager
-from .image_processor import ImageProcessor
-from .ranking_algorithm import RankingAlgorithm
-from .prompt_analyzer import PromptAnalyzer
-from .metadata_extractor import MetadataExtractor
-from .weight_manager import WeightManager
-from .confidence_calculator import ConfidenceCalculator
-from .data_persistence import DataPersistence
-from .algorithm_settings import AlgorithmSettings
-from .image_binner import ImageBinner
+import importlib
 
-from .similarity_manager import SimilarityManager
+# Submodules are resolved on first attribute access, so importing one core
+# module (e.g. core.data_manager) does not load every other one with it.
+_LAZY_EXPORTS = {
+    'DataManager': '.data_manager',
+    'ImageProcessor': '.image_processor',
+    'RankingAlgorithm': '.ranking_algorithm',
+    'PromptAnalyzer': '.prompt_analyzer',
+    'MetadataExtractor': '.metadata_extractor',
+    'WeightManager': '.weight_manager',
+    'ConfidenceCalculator': '.confidence_calculator',
+    'DataPersistence': '.data_persistence',
+    'AlgorithmSettings': '.algorithm_settings',
+    'ImageBinner': '.image_binner',
+    'SimilarityManager': '.similarity_manager',
+}
 
 __all__ = ['DataManager', 'ImageProcessor', 'RankingAlgorithm', 'PromptAnalyzer', 'MetadataExtractor', 'WeightManager', 'ConfidenceCalculator', 'DataPersistence', 'AlgorithmSettings', 'ImageBinner', 'SimilarityManager']
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
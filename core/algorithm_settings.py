@@ -1,7 +1,10 @@
 """Algorithm settings management for the Image Ranking System - tier bounds system removed."""
 
+import logging
 from typing import Dict, Any
 
+log = logging.getLogger(__name__)
+
 
 class AlgorithmSettings:
     """Manages algorithm configuration and parameters."""
@@ -103,7 +106,7 @@ class AlgorithmSettings:
             True if set successfully, False if invalid
         """
         if not self.validate_setting(setting_name, value):
-            print(f"Invalid value for {setting_name}: {value}")
+            log.warning("Invalid value for %s: %s", setting_name, value)
             return False
         
         setattr(self, setting_name, value)
@@ -181,7 +184,7 @@ class AlgorithmSettings:
             self.set_value('zone_votes_per_tier',
                           settings.get('zone_votes_per_tier', self.DEFAULT_ZONE_VOTES_PER_TIER))
             
-            print(f"Loaded algorithm settings v{settings.get('algorithm_version', '2.2')}")
+            log.debug("Loaded algorithm settings v%s", settings.get('algorithm_version', '2.2'))
         else:
             # Set defaults if no settings found
             self.reset_to_defaults()
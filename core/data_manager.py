@@ -1,6 +1,9 @@
 """Enhanced Data Manager with image binning support - tier bounds system removed."""
 
 import os
+import sys
+import logging
+import threading
 from typing import Dict, Any, Optional, Tuple
 from collections import defaultdict
 
@@ -10,6 +13,8 @@ from core.data_persistence import DataPersistence
 from core.algorithm_settings import AlgorithmSettings
 from core.similarity_manager import SimilarityManager
 
+log = logging.getLogger(__name__)
+
 
 class DataManager:
     """Handles data persistence and ranking statistics with image binning."""
@@ -19,6 +24,9 @@ class DataManager:
         self.data_persistence = DataPersistence()
         self.algorithm_settings = AlgorithmSettings()
         self.similarity_manager = SimilarityManager()
+        # Guards _prompt_count and the prompt writes it tracks; metadata
+        # results are applied from the collector thread
+        self._prompt_lock = threading.Lock()
         self.reset_data()
     
     def reset_data(self):
@@ -28,6 +36,11 @@ class DataManager:
         self.image_stats = {}
         self.metadata_cache = {}
         self.binned_images = set()  # Track binned image filenames
+        self._last_loaded = None  # Snapshot of the last file loaded or saved
+        self.modification_count = 0  # Bumped by every change a save would record
+        with self._prompt_lock:
+            self._prompt_count = None  # Images with a prompt; None until first requested
+        self._counts_cache = None  # (image_stats, binned_images, (active, binned)) from get_counts()
         self.weight_manager.reset_to_defaults()
         self.algorithm_settings.reset_to_defaults()
     
@@ -49,9 +62,21 @@ class DataManager:
             return False
         
         self.binned_images.add(image_name)
-        print(f"Image '{image_name}' has been binned")
+        self.invalidate_counts()
+        self.mark_modified()
+        log.debug("Image '%s' has been binned", image_name)
         return True
     
+    def unbin_image(self, image_name: str) -> None:
+        """Return a binned image to active ranking, e.g. when moving its file failed."""
+        self.binned_images.discard(image_name)
+        self.invalidate_counts()
+        self.mark_modified()
+    
+    def mark_modified(self) -> None:
+        """Record a change a save would write: votes, bins, purges, weights, settings or filters."""
+        self.modification_count += 1
+    
     def purge_binned_image_votes(self, binned_image: str) -> Dict[str, Any]:
         """
         Remove all vote history involving a binned image from active images.
@@ -127,12 +152,14 @@ class DataManager:
             stats['current_tier'] = new_tier
             stats['tier_history'] = new_tier_history
             
-            print(f"  Purged {votes_removed} vote(s) involving '{binned_image}' from '{img_name}' "
-                  f"(tier: {old_tier} -> {new_tier})")
+            log.debug("Purged %s vote(s) involving '%s' from '%s' (tier: %s -> %s)",
+                      votes_removed, binned_image, img_name, old_tier, new_tier)
         
-        print(f"Vote purge complete for '{binned_image}': "
-              f"{affected_images} images affected, {total_votes_removed} votes removed")
+        log.debug("Vote purge complete for '%s': %s images affected, %s votes removed",
+                  binned_image, affected_images, total_votes_removed)
         
+        if affected_images:
+            self.mark_modified()
         return {
             'affected_images': affected_images,
             'total_votes_removed': total_votes_removed
@@ -149,7 +176,7 @@ class DataManager:
             Dict with purge statistics
         """
         if not self.binned_images:
-            print("No binned images found - nothing to purge")
+            log.debug("No binned images found - nothing to purge")
             return {'total_affected': 0, 'total_removed': 0, 'binned_processed': 0}
         
         total_affected = 0
@@ -169,10 +196,10 @@ class DataManager:
                 total_removed += result['total_votes_removed']
         
         if total_removed > 0:
-            print(f"Purge complete: {total_removed} stale vote(s) removed "
-                  f"from {total_affected} image(s) across {len(self.binned_images)} binned image(s)")
+            log.debug("Purge complete: %s stale vote(s) removed from %s image(s) across %s binned image(s)",
+                      total_removed, total_affected, len(self.binned_images))
         else:
-            print("Purge complete: no stale votes found (already clean)")
+            log.debug("Purge complete: no stale votes found (already clean)")
         
         return {
             'total_affected': total_affected,
@@ -182,32 +209,48 @@ class DataManager:
     
     def is_image_binned(self, image_name: str) -> bool:
         """Check if an image is binned."""
-        if not hasattr(self, 'binned_images'):
-            self.binned_images = set()
         return image_name in self.binned_images
     
     def get_active_images(self) -> list:
         """Get list of active (non-binned) image names."""
-        if not hasattr(self, 'binned_images'):
-            self.binned_images = set()
         return [img for img in self.image_stats.keys() if img not in self.binned_images]
     
     def get_binned_images(self) -> list:
         """Get list of binned image names."""
-        if not hasattr(self, 'binned_images'):
-            self.binned_images = set()
         return list(self.binned_images)
     
     def get_active_image_count(self) -> int:
-        """Get count of active (non-binned) images."""
-        return len(self.get_active_images())
+        """Get count of active (non-binned) images without building the active list."""
+        return self.get_counts()[0]
     
     def get_binned_image_count(self) -> int:
         """Get count of binned images."""
-        if not hasattr(self, 'binned_images'):
-            self.binned_images = set()
         return len(self.binned_images)
     
+    def get_counts(self) -> Tuple[int, int]:
+        """
+        Get the active and binned image counts together.
+        
+        Returns:
+            Tuple of (active_count, binned_count)
+        """
+        image_stats = self.image_stats
+        binned_images = self.binned_images
+        # Changes inside the containers call invalidate_counts(); the containers
+        # themselves are kept (not their id()) so a replaced one is always noticed
+        cached = self._counts_cache
+        if cached is not None and cached[0] is image_stats and cached[1] is binned_images:
+            return cached[2]
+        
+        binned_known = sum(1 for img in binned_images if img in image_stats)
+        counts = (len(image_stats) - binned_known, len(binned_images))
+        self._counts_cache = (image_stats, binned_images, counts)
+        return counts
+    
+    def invalidate_counts(self) -> None:
+        """Forget the memoized get_counts() result after images are added, binned or unbinned."""
+        self._counts_cache = None
+    
     def has_pair_been_tested(self, img1: str, img2: str) -> bool:
         """Check if two images have already been tested against each other."""
         if img1 not in self.image_stats or img2 not in self.image_stats:
@@ -219,6 +262,7 @@ class DataManager:
     def record_vote(self, winner: str, loser: str) -> None:
         """Record a vote between two images."""
         self.vote_count += 1
+        self.mark_modified()
         self.image_stats[winner]['tested_against'].add(loser)
         self.image_stats[loser]['tested_against'].add(winner)    
         
@@ -249,22 +293,33 @@ class DataManager:
     
     def save_to_file(self, filename: str, filter_state: Optional[Dict[str, Any]] = None) -> bool:
         """Save all ranking data including tested pairs and optional filter state."""
-        # Convert sets to lists for JSON serialization
-        serializable_stats = {}
-        for img_name, stats in self.image_stats.items():
-            stats_copy = stats.copy()
-            # Convert set to list for JSON
-            if 'tested_against' in stats_copy:
-                stats_copy['tested_against'] = list(stats_copy['tested_against'])
-            serializable_stats[img_name] = stats_copy
-        
-        # Prepare core data
+        sync_state = self.get_sync_state()
+        if not self.write_save_data(filename, self.snapshot_save_data(filter_state)):
+            return False
+        self.mark_file_synced(filename, sync_state)
+        return True
+    
+    def snapshot_save_data(self, filter_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Copy everything a save writes (Tk thread).
+        
+        Each image's stats and metadata entry is copied one level deep: a
+        dict copy per image, so the scalar fields (votes, tier, prompt) match
+        the state the save is marked synced with. The tier_history,
+        matchup_history and tested_against containers are shared rather
+        than copied, since copying them for every image on every save costs
+        more than the save itself. They only grow, and each entry is encoded
+        in one call that holds the GIL, so a vote landing mid-save at most
+        adds itself to a history; that vote still counts as unsaved.
+        """
+        # list() takes the items in one step; the metadata thread may add
+        # cache entries while this runs
         core_data = {
             'image_folder': self.image_folder,
             'vote_count': self.vote_count,
-            'image_stats': serializable_stats,  # Use serializable version
-            'metadata_cache': self.metadata_cache,
-            'binned_images': list(self.binned_images)
+            'image_stats': {name: dict(stats) for name, stats in list(self.image_stats.items())},
+            'metadata_cache': {name: dict(entry) for name, entry in list(self.metadata_cache.items())},
+            'binned_images': set(self.binned_images)
         }
         
         # Gather all settings
@@ -272,11 +327,50 @@ class DataManager:
         algorithm_settings = self.algorithm_settings.export_settings()
         
         # Prepare complete save data with optional filter state
-        save_data = self.data_persistence.prepare_save_data(
+        return self.data_persistence.prepare_save_data(
             core_data, weight_data, algorithm_settings, filter_state)
-        
-        # Save to file
+    
+    def write_save_data(self, filename: str, save_data: Dict[str, Any]) -> bool:
+        """Write data from snapshot_save_data(); safe to run in a worker thread."""
         return self.data_persistence.save_to_file(filename, save_data)
+    
+    def get_sync_state(self) -> Tuple:
+        """The in-memory state a save or load is matched against."""
+        return (self.image_folder, self.vote_count, len(self.binned_images), self.modification_count)
+    
+    def mark_file_synced(self, filename: str, sync_state: Optional[Tuple] = None) -> None:
+        """
+        Remember that the in-memory data matches the given save file.
+        
+        Args:
+            filename: The file just saved or loaded
+            sync_state: get_sync_state() from when the saved data was copied;
+                defaults to the current state
+        """
+        try:
+            mtime = os.path.getmtime(filename)
+        except OSError:
+            self._last_loaded = None
+            return
+        if sync_state is None:
+            sync_state = self.get_sync_state()
+        self._last_loaded = (os.path.abspath(filename), mtime) + sync_state
+    
+    def is_file_unchanged_since_load(self, filename: str) -> bool:
+        """
+        Check whether loading the given file would be a no-op.
+        
+        True when the file is the one last loaded or saved, it has not been
+        modified on disk since, and nothing a save would record has changed in
+        between (see mark_modified()).
+        """
+        if not self._last_loaded:
+            return False
+        try:
+            mtime = os.path.getmtime(filename)
+        except OSError:
+            return False
+        return self._last_loaded == (os.path.abspath(filename), mtime) + self.get_sync_state()
 
     def load_from_file(self, filename: str) -> Tuple[bool, str]:
         """Load ranking data including tested pairs."""
@@ -295,13 +389,10 @@ class DataManager:
         self.image_stats = core_data['image_stats']
         self.metadata_cache = core_data['metadata_cache']
         self.binned_images = core_data['binned_images']
+        self.invalidate_counts()
         
-        # Convert tested_against lists back to sets
-        for img_name, stats in self.image_stats.items():
-            if 'tested_against' in stats and isinstance(stats['tested_against'], list):
-                stats['tested_against'] = set(stats['tested_against'])
-            elif 'tested_against' not in stats:
-                stats['tested_against'] = set()  # Add missing field for old saves
+        # Convert tested_against lists back to sets and fill in missing fields
+        self.normalize_loaded_stats()
         
         # Load other settings
         self.weight_manager.load_from_data(data)
@@ -314,10 +405,7 @@ class DataManager:
         # Update existing images with strategic timing
         self._update_existing_images_with_strategic_timing()
         
-        # Initialize all image stats (ensures tested_against field exists)
-        for image_filename in self.image_stats:
-            self.initialize_image_stats(image_filename)
-        
+        self.mark_file_synced(filename)
         return True, ""
     
     def get_pair_stats(self) -> Dict[str, Any]:
@@ -325,8 +413,8 @@ class DataManager:
         total_pairs_tested = 0
         total_possible_pairs = 0
         
-        active_images = self.get_active_images()
-        total_possible_pairs = len(active_images) * (len(active_images) - 1) // 2
+        active_count = self.get_active_image_count()
+        total_possible_pairs = active_count * (active_count - 1) // 2
         
         # Count unique tested pairs
         tested_pairs = set()
@@ -476,7 +564,7 @@ class DataManager:
                 )
                 avg_votes_per_active_image = total_active_votes / total_active_images
             except (KeyError, ZeroDivisionError, TypeError) as e:
-                print(f"Error calculating average votes per active image: {e}")
+                log.warning("Error calculating average votes per active image: %s", e)
                 avg_votes_per_active_image = 0
             
             # Calculate average votes per total image (for backward compatibility)
@@ -487,7 +575,7 @@ class DataManager:
                 )
                 avg_votes_per_image = total_all_votes / total_images if total_images > 0 else 0
             except (KeyError, ZeroDivisionError, TypeError) as e:
-                print(f"Error calculating average votes per total image: {e}")
+                log.warning("Error calculating average votes per total image: %s", e)
                 avg_votes_per_image = 0
             
             return {
@@ -500,8 +588,8 @@ class DataManager:
                 'tier_distribution': self.get_tier_distribution()
             }
             
-        except Exception as e:
-            print(f"Error in get_overall_statistics: {e}")
+        except Exception:
+            log.exception("Error in get_overall_statistics")
             # Return safe defaults
             return {
                 'total_images': len(self.image_stats),
@@ -522,9 +610,11 @@ class DataManager:
     
     def set_left_weights(self, weights: Dict[str, float]) -> None:
         self.weight_manager.set_left_weights(weights)
+        self.mark_modified()
     
     def set_right_weights(self, weights: Dict[str, float]) -> None:
         self.weight_manager.set_right_weights(weights)
+        self.mark_modified()
     
     def get_left_priority_preferences(self) -> Dict[str, bool]:
         return self.weight_manager.get_left_priority_preferences()
@@ -534,15 +624,19 @@ class DataManager:
     
     def set_left_priority_preferences(self, preferences: Dict[str, bool]) -> None:
         self.weight_manager.set_left_priority_preferences(preferences)
+        self.mark_modified()
     
     def set_right_priority_preferences(self, preferences: Dict[str, bool]) -> None:
         self.weight_manager.set_right_priority_preferences(preferences)
+        self.mark_modified()
     
     def initialize_image_stats(self, image_filename: str) -> None:
         """Initialize stats for a new image with strategic placement."""
         if image_filename not in self.image_stats:
+            image_filename = sys.intern(image_filename)
             strategic_last_voted = self._calculate_strategic_last_voted(image_filename)
             
+            self.invalidate_counts()
             self.image_stats[image_filename] = {
                 'votes': 0,
                 'wins': 0,
@@ -576,6 +670,26 @@ class DataManager:
         
         self.restore_metadata_from_cache(image_filename)
     
+    def normalize_loaded_stats(self) -> None:
+        """
+        Prepare freshly loaded image stats in a single pass.
+        
+        Converts tested_against lists back to sets (adding the field for old
+        saves) and fills in any missing per-image fields.
+        """
+        with self._prompt_lock:
+            self._prompt_count = None  # image_stats was replaced
+        intern = sys.intern
+        initialize = self.initialize_image_stats
+        for img_name, stats in self.image_stats.items():
+            tested_against = stats.get('tested_against')
+            if tested_against is None:
+                stats['tested_against'] = set()
+            elif type(tested_against) is not set:
+                # Saved files hold lists; stats that are already sets are kept as-is
+                stats['tested_against'] = set(map(intern, tested_against))
+            initialize(img_name)
+    
     def _calculate_strategic_last_voted(self, image_filename: str) -> int:
         """Calculate strategic last_voted value for a new image."""
         if not self.image_stats or image_filename in self.image_stats:
@@ -621,19 +735,35 @@ class DataManager:
                 updated_count += 1
         
         if updated_count > 0:
-            print(f"Updated {updated_count} never-voted images with strategic timing")
+            log.debug("Updated %s never-voted images with strategic timing", updated_count)
     
     def set_image_metadata(self, image_filename: str, prompt: Optional[str] = None, 
                           display_metadata: Optional[str] = None) -> None:
         """Set metadata for an image and update cache."""
         if image_filename in self.image_stats:
             if prompt is not None:
-                self.image_stats[image_filename]['prompt'] = prompt
+                self._set_prompt(self.image_stats[image_filename], prompt)
             if display_metadata is not None:
                 self.image_stats[image_filename]['display_metadata'] = display_metadata
             
             self.update_metadata_cache(image_filename, prompt, display_metadata)
     
+    @property
+    def prompt_count(self) -> int:
+        """Number of images with a non-empty prompt (counted once, then kept up to date)."""
+        with self._prompt_lock:
+            if self._prompt_count is None:
+                self._prompt_count = sum(1 for stats in list(self.image_stats.values())
+                                         if stats.get('prompt'))
+            return self._prompt_count
+    
+    def _set_prompt(self, stats: Dict[str, Any], prompt: Optional[str]) -> None:
+        """Store an image's prompt, keeping the cached prompt count in step."""
+        with self._prompt_lock:
+            if self._prompt_count is not None and bool(stats.get('prompt')) != bool(prompt):
+                self._prompt_count += 1 if prompt else -1
+            stats['prompt'] = prompt
+    
     def update_metadata_cache(self, image_filename: str, prompt: Optional[str] = None, 
                              display_metadata: Optional[str] = None) -> None:
         """Update the metadata cache for an image."""
@@ -673,7 +803,7 @@ class DataManager:
                     
                     if abs(current_mtime - cached_mtime) < 1.0:
                         stats = self.image_stats[image_filename]
-                        stats['prompt'] = cached_data.get('prompt')
+                        self._set_prompt(stats, cached_data.get('prompt'))
                         stats['display_metadata'] = cached_data.get('display_metadata')
                         return
         except (OSError, KeyError):
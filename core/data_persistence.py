@@ -1,21 +1,44 @@
 """Data persistence handler for the Image Ranking System with binning support - tier bounds system removed."""
 
 import json
+import logging
 import os
+import sys
 from datetime import datetime
 from typing import Dict, Any, Tuple, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types the json module does not handle natively."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class DataPersistence:
     """Handles saving and loading data to/from JSON files including binned images."""
     
     CURRENT_VERSION = '2.2'
     REQUIRED_FIELDS = ['image_folder', 'vote_count', 'image_stats']
+    # Large per-image mappings that are written one entry at a time
+    STREAMED_FIELDS = ('image_stats', 'metadata_cache')
     
     def save_to_file(self, filename: str, data: Dict[str, Any]) -> bool:
         """
         Save data to a JSON file.
         
+        The per-image mappings are encoded entry by entry, so the full
+        document is never built in memory. Sets are written as lists.
+        Uses orjson for encoding when it is installed.
+        
         Args:
             filename: Path to save the file
             data: Dictionary containing all data to save
@@ -28,19 +51,75 @@ class DataPersistence:
             data['timestamp'] = datetime.now().isoformat()
             data['version'] = self.CURRENT_VERSION
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                self._write_json_stream(f, data)
             
             return True
             
-        except Exception as e:
-            print(f"Error saving data: {e}")
+        except Exception:
+            log.exception("Error saving data")
             return False
     
+    def _write_json_stream(self, f, data: Dict[str, Any]) -> None:
+        """Write data as a JSON object, streaming the large per-image mappings."""
+        f.write(b'{')
+        separator = b'\n  '
+        for key, value in data.items():
+            f.write(separator)
+            f.write(self._encode(key))
+            f.write(b': ')
+            if key in self.STREAMED_FIELDS and isinstance(value, dict):
+                self._write_json_mapping(f, value)
+            else:
+                f.write(self._encode(value))
+            separator = b',\n  '
+        f.write(b'\n}\n')
+    
+    def _write_json_mapping(self, f, mapping: Dict[str, Any]) -> None:
+        """Write a mapping one key/value pair at a time."""
+        if not mapping:
+            f.write(b'{}')
+            return
+        
+        encode = self._encode
+        write = f.write
+        write(b'{')
+        separator = b'\n    '
+        # mapping comes from DataManager.snapshot_save_data(), which nothing
+        # else mutates, so it can be iterated directly
+        for key, value in mapping.items():
+            # Encoding a one-entry dict and dropping its braces produces the
+            # "key": value pair in a single encoder call and a single write
+            write(separator + encode({key: value})[1:-1])
+            separator = b',\n    '
+        write(b'\n  }')
+    
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Encode a single value as UTF-8 JSON."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(value, default=_json_default)
+        return json.dumps(value, ensure_ascii=False, default=_json_default).encode('utf-8')
+    
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        """Parse UTF-8 JSON, with orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN and Infinity, which the json module
+                # writes and reads, so older save files may still need it
+                pass
+        return json.loads(raw)
+    
     def load_from_file(self, filename: str) -> Tuple[bool, Dict[str, Any], str]:
         """
         Load data from a JSON file.
         
+        Uses orjson for parsing when it is installed, and the json module
+        for files orjson rejects.
+        
         Args:
             filename: Path to load the file from
             
@@ -48,8 +127,9 @@ class DataPersistence:
             Tuple of (success, data, error_message)
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            data = self._decode(raw)
             
             # Validate required fields
             for field in self.REQUIRED_FIELDS:
@@ -89,7 +169,7 @@ class DataPersistence:
                     fixed_count += 1
             
             if fixed_count > 0:
-                print(f"Corrected vote count inconsistencies for {fixed_count} images")
+                log.debug("Corrected vote count inconsistencies for %s images", fixed_count)
         
         return data
     
@@ -133,12 +213,16 @@ class DataPersistence:
         Returns:
             Dictionary with only core data fields
         """
+        # Intern filenames so they share identity with the scanned file list
+        intern = sys.intern
+        image_stats = {intern(name): stats for name, stats in data.get('image_stats', {}).items()}
+        
         return {
             'image_folder': data.get('image_folder', ''),
             'vote_count': data.get('vote_count', 0),
-            'image_stats': data.get('image_stats', {}),
+            'image_stats': image_stats,
             'metadata_cache': data.get('metadata_cache', {}),
-            'binned_images': set(data.get('binned_images', []))  # Convert to set
+            'binned_images': set(map(intern, data.get('binned_images', [])))  # Convert to set
         }
     
     def get_version(self, data: Dict[str, Any]) -> str:
@@ -167,9 +251,9 @@ class DataPersistence:
             # Remove tier bounds settings if present from older versions
             if 'tier_bounds_settings' in data:
                 del data['tier_bounds_settings']
-                print(f"Removed deprecated tier bounds settings from version {version}")
+                log.debug("Removed deprecated tier bounds settings from version %s", version)
             
-            print(f"Migrated data from version {version} to {self.CURRENT_VERSION}")
+            log.debug("Migrated data from version %s to %s", version, self.CURRENT_VERSION)
         
         return data
     
@@ -192,6 +276,6 @@ class DataPersistence:
                 with open(backup_name, 'w') as backup:
                     backup.write(source.read())
             return backup_name
-        except Exception as e:
-            print(f"Error creating backup: {e}")
+        except Exception:
+            log.exception("Error creating backup")
             return None
@@ -1,8 +1,11 @@
 """Filter manager for prompt-based image filtering."""
 
+import logging
 from typing import Dict, List, Set, Any, Optional
 from collections import defaultdict
 
+log = logging.getLogger(__name__)
+
 
 class FilterManager:
     """Manages filtering of images based on prompt word criteria."""
@@ -44,7 +47,7 @@ class FilterManager:
                 self.word_index[word].add(image_name)
         
         self.index_built = True
-        print(f"FilterManager: Built word index with {len(self.word_index)} unique words")
+        log.debug("Built word index with %s unique words", len(self.word_index))
     
     def rebuild_index_if_needed(self) -> None:
         """Rebuild index if images have changed."""
@@ -62,6 +65,7 @@ class FilterManager:
         
         # Add to include
         self.include_words.add(word_lower)
+        self.data_manager.mark_modified()
         return True
     
     def add_exclude_word(self, word: str) -> bool:
@@ -75,6 +79,7 @@ class FilterManager:
         
         # Add to exclude
         self.exclude_words.add(word_lower)
+        self.data_manager.mark_modified()
         return True
     
     def remove_include_word(self, word: str) -> bool:
@@ -82,6 +87,7 @@ class FilterManager:
         word_lower = word.lower().strip()
         if word_lower in self.include_words:
             self.include_words.remove(word_lower)
+            self.data_manager.mark_modified()
             return True
         return False
     
@@ -90,6 +96,7 @@ class FilterManager:
         word_lower = word.lower().strip()
         if word_lower in self.exclude_words:
             self.exclude_words.remove(word_lower)
+            self.data_manager.mark_modified()
             return True
         return False
     
@@ -97,11 +104,13 @@ class FilterManager:
         """Clear all filters."""
         self.include_words.clear()
         self.exclude_words.clear()
+        self.data_manager.mark_modified()
     
     def set_filter_logic(self, logic: str) -> None:
         """Set filter logic to 'AND' or 'OR'."""
         if logic in ['AND', 'OR']:
             self.filter_logic = logic
+            self.data_manager.mark_modified()
     
     def is_active(self) -> bool:
         """Check if any filters are active."""
@@ -174,9 +183,13 @@ class FilterManager:
     
     def get_filter_stats(self) -> Dict[str, Any]:
         """Get statistics about current filters."""
-        total_active = len(self.data_manager.get_active_images())
-        filtered_images = self.get_filtered_images()
-        filtered_count = len(filtered_images)
+        is_active = self.is_active()
+        total_active = self.data_manager.get_active_image_count()
+        if is_active:
+            filtered_count = len(self.get_filtered_images())
+        else:
+            # Every active image passes, so skip building the filtered list
+            filtered_count = total_active
         
         return {
             'total_active_images': total_active,
@@ -185,7 +198,7 @@ class FilterManager:
             'include_words': list(self.include_words),
             'exclude_words': list(self.exclude_words),
             'filter_logic': self.filter_logic,
-            'is_active': self.is_active(),
+            'is_active': is_active,
             'total_unique_words': len(self.word_index)
         }
     
@@ -1,6 +1,8 @@
 """Optimized image processor with file scanning and metadata extraction."""
 
 import os
+import sys
+import logging
 import fnmatch
 from typing import Optional, Tuple, List, Set
 from PIL import Image, ImageTk
@@ -11,6 +13,8 @@ from config import Defaults
 from core.metadata_extractor import MetadataExtractor
 from core.image_binner import ImageBinner
 
+log = logging.getLogger(__name__)
+
 
 class ImageProcessor:
     """Optimized image processor for large collections."""
@@ -78,23 +82,38 @@ class ImageProcessor:
                             full_path = os.path.join(root, file)
                             relative_path = os.path.relpath(full_path, folder_path)
                             relative_path = relative_path.replace(os.sep, '/')
-                            image_files.append(relative_path)
+                            # Interned so dict lookups keyed by filename can short-circuit on identity
+                            image_files.append(sys.intern(relative_path))
             
             return sorted(image_files)
             
         except OSError as e:
-            print(f"Error scanning directory {folder_path}: {e}")
+            log.warning("Error scanning directory %s: %s", folder_path, e)
             return []
         
     def load_and_resize_image(self, image_path: str, max_width: int, max_height: int) -> Optional[ImageTk.PhotoImage]:
         """Load an image and resize it with optimizations."""
+        img = self.open_resized_image(image_path, max_width, max_height)
+        return self.to_photo_image(img) if img is not None else None
+    
+    def open_resized_image(self, image_path: str, max_width: int, max_height: int) -> Optional[Image.Image]:
+        """
+        Decode an image and scale it to fit the given size.
+        
+        Only PIL is used here, so this may run in a worker thread; the
+        result is turned into a PhotoImage on the Tk thread with
+        to_photo_image().
+        """
         try:
             with Image.open(image_path) as img:
+                # Lets JPEGs decode at 1/2, 1/4 or 1/8 scale, keeping at least
+                # twice the target size so the final resize stays sharp; other
+                # formats ignore it
+                img.draft(img.mode, (max_width * 2, max_height * 2))
                 img_width, img_height = img.size
                 
                 if img_width <= max_width and img_height <= max_height:
-                    img_copy = img.copy()
-                    return ImageTk.PhotoImage(img_copy)
+                    return img.copy()
                 
                 width_ratio = max_width / img_width
                 height_ratio = max_height / img_height
@@ -105,13 +124,26 @@ class ImageProcessor:
                 
                 resample_method = Image.Resampling.BILINEAR if (new_width * new_height) > 500000 else Image.Resampling.LANCZOS
                 
-                resized_img = img.resize((new_width, new_height), resample_method)
-                return ImageTk.PhotoImage(resized_img)
+                return img.resize((new_width, new_height), resample_method)
             
         except Exception as e:
-            print(f"Error loading image {image_path}: {e}")
+            log.warning("Error loading image %s: %s", image_path, e)
             return None
     
+    @staticmethod
+    def to_photo_image(img: Image.Image) -> ImageTk.PhotoImage:
+        """
+        Copy a decoded image into Tk for display (Tk thread only).
+        
+        The PIL image is closed afterwards, since Tk keeps its own copy of
+        the pixels; its buffer is released here rather than whenever the
+        last reference happens to go away.
+        """
+        try:
+            return ImageTk.PhotoImage(img)
+        finally:
+            img.close()
+    
     def get_binned_image_files(self, folder_path: str) -> List[str]:
         """Get image files from the Bin folder for word analysis."""
         bin_folder = os.path.join(folder_path, "Bin")
@@ -137,7 +169,7 @@ class ImageProcessor:
             return sorted(image_files)
             
         except OSError as e:
-            print(f"Error scanning folder {folder_path}: {e}")
+            log.warning("Error scanning folder %s: %s", folder_path, e)
             return []
     
     def extract_prompt_from_image(self, image_path: str) -> Optional[str]:
@@ -1,12 +1,15 @@
 """Metadata extraction for the Image Ranking System."""
 
 import os
+import logging
 from typing import Optional, List
 from PIL import Image
 from PIL.ExifTags import TAGS
 
 from config import Defaults
 
+log = logging.getLogger(__name__)
+
 
 class MetadataExtractor:
     """Handles extraction of metadata and prompts from images."""
@@ -36,12 +39,12 @@ class MetadataExtractor:
                         if prompt:
                             return prompt
                 except Exception as exif_error:
-                    print(f"Error reading EXIF data from {image_path}: {exif_error}")
+                    log.warning("Error reading EXIF data from %s: %s", image_path, exif_error)
                 
                 return None
             
         except Exception as e:
-            print(f"Error extracting prompt from {image_path}: {e}")
+            log.warning("Error extracting prompt from %s: %s", image_path, e)
             return None
     
     def get_image_metadata(self, image_path: str) -> Optional[str]:
@@ -63,7 +66,7 @@ class MetadataExtractor:
                     if exifdata:
                         self._add_exif_metadata(exifdata, metadata_lines)
                 except Exception as exif_error:
-                    print(f"Error reading EXIF data from {image_path}: {exif_error}")
+                    log.warning("Error reading EXIF data from %s: %s", image_path, exif_error)
                     metadata_lines.append("EXIF data unavailable")
                 
                 if len(metadata_lines) > 10:
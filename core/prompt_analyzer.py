@@ -214,15 +214,14 @@ class PromptAnalyzer:
                 'high_binning_rate_words': 0
             }
         
-        active_images_with_prompts = len([
-            img for img, stats in self.data_manager.image_stats.items()
-            if stats.get('prompt') and not self.data_manager.is_image_binned(img)
-        ])
-        
-        binned_images_with_prompts = len([
-            img for img, stats in self.data_manager.image_stats.items()
-            if stats.get('prompt') and self.data_manager.is_image_binned(img)
-        ])
+        # prompt_count is kept up to date by DataManager, so only the (usually
+        # small) binned set is walked here
+        image_stats = self.data_manager.image_stats
+        binned_images_with_prompts = sum(
+            1 for img in self.data_manager.binned_images
+            if img in image_stats and image_stats[img].get('prompt')
+        )
+        active_images_with_prompts = self.data_manager.prompt_count - binned_images_with_prompts
         
         rare_words = sum(1 for data in word_analysis.values() if data['is_rare'])
         
@@ -742,7 +742,7 @@ class RankingAlgorithm:
                         if self.data_manager.get_image_stats(img).get('current_tier', 0) == tier1
                         and not self.data_manager.is_image_binned(img))
             
-            total_images = len(self.data_manager.get_active_images())
+            total_images = self.data_manager.get_active_image_count()
             expected_proportion = self._calculate_expected_tier_proportion(tier1, total_images)
             expected_size = expected_proportion * total_images
             
@@ -19,6 +19,12 @@ import threading
 from collections import Counter
 from typing import List, Optional, Dict, Callable, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ---------------------------------------------------------------------------
 # Dependency auto-installer
 # ---------------------------------------------------------------------------
@@ -367,8 +373,10 @@ class SimilarityManager:
                 self.text_embeddings = data["text_embeddings"].astype(np.float32)
                 self.has_text        = data["has_text"].astype(bool)
                 tags_json            = data["prompt_tags_json"]
+                # One small document per image, so the parser matters on large folders
+                loads                = orjson.loads if ORJSON_AVAILABLE else json.loads
                 self.prompt_tags     = {
-                    self.filenames[i]: json.loads(str(tags_json[i]))
+                    self.filenames[i]: loads(str(tags_json[i]))
                     for i in range(len(self.filenames))
                 }
                 has_count = int(self.has_text.sum())
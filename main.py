@@ -1,6 +1,7 @@
 """Main entry point for the Image Ranking System."""
 
 import tkinter as tk
+import logging
 import sys
 import os
 
@@ -11,6 +12,12 @@ from ui.main_window import MainWindow
 
 def main():
     """Initialize and run the application."""
+    # Set IMAGE_RANKING_DEBUG=1 to see debug output from the UI modules
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get('IMAGE_RANKING_DEBUG') else logging.WARNING,
+        format='%(name)s: %(levelname)s: %(message)s'
+    )
+    
     root = tk.Tk()
     root.title("Image Ranking System")
     root.state('zoomed')
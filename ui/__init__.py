@@ -1,8 +1,21 @@
 """UI components for the Image Ranking System."""
 
-from .main_window import MainWindow
-from .stats_window import StatsWindow
-from .settings_window import SettingsWindow
-from .mixins import ImagePreviewMixin
+import importlib
 
-__all__ = ['MainWindow', 'StatsWindow', 'SettingsWindow', 'ImagePreviewMixin']
\ No newline at end of file
+# Windows are resolved on first attribute access so that importing
+# ui.main_window does not also load the stats and settings windows.
+_LAZY_EXPORTS = {
+    'MainWindow': '.main_window',
+    'StatsWindow': '.stats_window',
+    'SettingsWindow': '.settings_window',
+    'ImagePreviewMixin': '.mixins',
+}
+
+__all__ = ['MainWindow', 'StatsWindow', 'SettingsWindow', 'ImagePreviewMixin']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,17 +5,24 @@ This package contains specialized UI components that were extracted from
 the main window to improve maintainability and separation of concerns.
 """
 
-from .image_display import ImageDisplayController
-from .voting_controller import VotingController
-from .metadata_processor import MetadataProcessor
-from .progress_tracker import ProgressTracker
-from .folder_manager import FolderManager
-from .ui_builder import UIBuilder
-from .chart_generator import ChartGenerator
-from .data_exporter import DataExporter
-from .prompt_analyzer_ui import PromptAnalyzerUI
-from .stats_table import StatsTable
-from .word_combination_analyzer_ui import WordCombinationAnalyzerUI
+import importlib
+
+# Components are resolved on first attribute access; importing one component
+# module (e.g. from the main window) does not pull in the stats-only ones and
+# their matplotlib dependency.
+_LAZY_EXPORTS = {
+    'ImageDisplayController': '.image_display',
+    'VotingController': '.voting_controller',
+    'MetadataProcessor': '.metadata_processor',
+    'ProgressTracker': '.progress_tracker',
+    'FolderManager': '.folder_manager',
+    'UIBuilder': '.ui_builder',
+    'ChartGenerator': '.chart_generator',
+    'DataExporter': '.data_exporter',
+    'PromptAnalyzerUI': '.prompt_analyzer_ui',
+    'StatsTable': '.stats_table',
+    'WordCombinationAnalyzerUI': '.word_combination_analyzer_ui',
+}
 
 __all__ = [
     'ImageDisplayController',
@@ -30,3 +37,10 @@ __all__ = [
     'StatsTable',
     'WordCombinationAnalyzerUI'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
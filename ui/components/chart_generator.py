@@ -120,21 +120,21 @@ class ChartGenerator:
         if self.chart_figure and MATPLOTLIB_AVAILABLE:
             try:
                 plt.close(self.chart_figure)
-            except:
+            except Exception:
                 pass
             self.chart_figure = None
         
         if self.chart_canvas:
             try:
                 self.chart_canvas.get_tk_widget().destroy()
-            except:
+            except tk.TclError:
                 pass
             self.chart_canvas = None
         
         if self.chart_widget:
             try:
                 self.chart_widget.destroy()
-            except:
+            except tk.TclError:
                 pass
             self.chart_widget = None
     
@@ -143,7 +143,7 @@ class ChartGenerator:
         for widget in parent_frame.winfo_children():
             try:
                 widget.destroy()
-            except:
+            except tk.TclError:
                 pass
         
         return self.create_tier_distribution_chart(parent_frame)
@@ -465,10 +465,7 @@ class DataExporter:
     
     def _has_prompt_data(self) -> bool:
         """Check if there is any prompt data available."""
-        for stats in self.data_manager.image_stats.values():
-            if stats.get('prompt'):
-                return True
-        return False
+        return self.data_manager.prompt_count > 0
     
     def get_export_options(self) -> Dict[str, str]:
         """Get available export options including combination analysis."""
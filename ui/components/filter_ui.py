@@ -196,9 +196,10 @@ class FilterUI:
         
         self._update_header_stats()
     
-    def _update_header_stats(self) -> None:
+    def _update_header_stats(self, stats: Optional[dict] = None) -> None:
         """Update the header stats label (visible when collapsed)."""
-        stats = self.filter_manager.get_filter_stats()
+        if stats is None:
+            stats = self.filter_manager.get_filter_stats()
         
         if stats['is_active']:
             filter_count = len(stats['include_words']) + len(stats['exclude_words'])
@@ -221,23 +222,31 @@ class FilterUI:
         pattern = self.search_var.get()
         results = self.filter_manager.search_words(pattern, limit=100)
         
-        self.search_listbox.delete(0, tk.END)
-        for word, frequency in results:
-            self.search_listbox.insert(tk.END, f"{word} ({frequency})")
+        self._set_listbox_items(
+            self.search_listbox, [f"{word} ({frequency})" for word, frequency in results])
     
     def _refresh_filter_lists(self) -> None:
         """Refresh the include and exclude filter lists."""
-        # Include list
-        self.include_listbox.delete(0, tk.END)
-        for word in sorted(self.filter_manager.include_words):
-            freq = self.filter_manager.get_word_frequency(word)
-            self.include_listbox.insert(tk.END, f"{word} ({freq})")
-        
-        # Exclude list
-        self.exclude_listbox.delete(0, tk.END)
-        for word in sorted(self.filter_manager.exclude_words):
-            freq = self.filter_manager.get_word_frequency(word)
-            self.exclude_listbox.insert(tk.END, f"{word} ({freq})")
+        get_frequency = self.filter_manager.get_word_frequency
+        self._set_listbox_items(
+            self.include_listbox,
+            [f"{word} ({get_frequency(word)})" for word in sorted(self.filter_manager.include_words)])
+        self._set_listbox_items(
+            self.exclude_listbox,
+            [f"{word} ({get_frequency(word)})" for word in sorted(self.filter_manager.exclude_words)])
+    
+    @staticmethod
+    def _set_listbox_items(listbox: tk.Listbox, items: list) -> None:
+        """Show items in a listbox, leaving it untouched if it already shows them."""
+        # Keeps the selection and scroll position when e.g. a keystroke does
+        # not change the search results
+        if listbox.get(0, tk.END) == tuple(items):
+            return
+        
+        listbox.delete(0, tk.END)
+        if items:
+            # One Tcl command for all rows instead of one per row
+            listbox.insert(tk.END, *items)
     
     def _update_stats(self) -> None:
         """Update the filter statistics display."""
@@ -255,8 +264,8 @@ class FilterUI:
                 foreground="gray"
             )
         
-        # Also update header stats
-        self._update_header_stats()
+        # Also update header stats from the same snapshot
+        self._update_header_stats(stats)
     
     def _get_selected_word_from_search(self) -> Optional[str]:
         """Get the selected word from search results."""
@@ -2,13 +2,21 @@
 
 import os
 import time
+import logging
+import tkinter as tk
 from tkinter import filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
+
+from config import Defaults
+
+log = logging.getLogger(__name__)
 
 
 class FolderManager:
     """Handles folder selection and image loading operations."""
     
-    def __init__(self, data_manager, image_processor, metadata_processor, progress_tracker):
+    def __init__(self, parent: tk.Tk, data_manager, image_processor, metadata_processor, progress_tracker):
+        self.parent = parent
         self.data_manager = data_manager
         self.image_processor = image_processor
         self.metadata_processor = metadata_processor
@@ -16,6 +24,7 @@ class FolderManager:
         
         self.folder_label = None
         self.status_bar = None
+        self.loaded_status_text = ""  # Last "Loaded ..." status, kept so callers can extend it
         
         self.on_load_complete_callback = None
         self.on_progress_callback = None
@@ -23,6 +32,11 @@ class FolderManager:
         # Reference to voting controller for initialization
         self.voting_controller = None
         
+        # Folder scans run off the Tk thread; results are picked up by polling
+        self.scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan")
+        self.scan_future = None
+        self.scan_poll_timer = None
+        
         self.metadata_processor.set_progress_callback(self._on_metadata_progress)
         self.metadata_processor.set_complete_callback(self._on_metadata_complete)
         
@@ -44,41 +58,104 @@ class FolderManager:
     def set_voting_controller_reference(self, voting_controller) -> None:
         """Set reference to voting controller for initialization."""
         self.voting_controller = voting_controller
-        print(f"Voting controller reference set: {voting_controller is not None}")
+        log.debug("Voting controller reference set: %s", voting_controller is not None)
     
     def select_folder(self) -> bool:
         """Handle folder selection for image loading."""
         folder = filedialog.askdirectory(title="Select folder containing images (includes subfolders)")
         if folder:
             self.data_manager.image_folder = folder
-            print(f"Selected folder: {folder}")
+            log.debug("Selected folder: %s", folder)
             self.load_images()
             return True
         return False
     
     def load_images(self) -> None:
-        """Load images from the selected folder."""
+        """
+        Load images from the selected folder.
+        
+        The folder is scanned on a worker thread so the window stays responsive
+        on large trees; the rest of the load continues on the Tk thread once
+        the scan finishes.
+        """
         if not self.data_manager.image_folder:
             return
         
-        start_time = time.time()
+        self._start_scan(self.data_manager.image_folder, self._finish_loading_images)
+    
+    def _start_scan(self, folder: str, on_scanned) -> None:
+        """Scan a folder in the scan thread and pass the images to on_scanned on the Tk thread."""
+        # A newer load request supersedes any scan still in flight
+        if self.scan_future:
+            self.scan_future.cancel()
+        if self.scan_poll_timer:
+            self.parent.after_cancel(self.scan_poll_timer)
+            self.scan_poll_timer = None
+        
+        if self.status_bar:
+            self.status_bar.config(text=f"Scanning {os.path.basename(folder)} for images...")
+        
+        self.scan_future = self.scan_executor.submit(self._scan_folder, folder)
+        # Always finish on a later tick, even for a cached scan, so callers can
+        # keep preparing data after starting the load
+        self.scan_poll_timer = self.parent.after_idle(
+            self._poll_scan, self.scan_future, folder, time.time(), on_scanned)
+    
+    def prefetch_folder(self, folder: str) -> None:
+        """
+        Start scanning a folder in the scan thread ahead of load_images().
         
+        The image processor keeps the listing cached, so the scan that
+        load_images() queues behind this one returns straight away. Safe to
+        call from any thread.
+        """
+        if folder:
+            self.scan_executor.submit(self._scan_folder, folder)
+    
+    def _scan_folder(self, folder: str) -> list:
+        """Scan a folder for images (runs in the scan thread)."""
         # Use compatible image file scanning
         try:
             # Try with exclude_bin_folder parameter first
-            images = self.image_processor.get_image_files(self.data_manager.image_folder, exclude_bin_folder=True)
+            return self.image_processor.get_image_files(folder, exclude_bin_folder=True)
         except TypeError:
             # Fallback for older image_processor without exclude_bin_folder parameter
-            print("Using fallback image scanning (older image_processor)")
-            images = self.image_processor.get_image_files(self.data_manager.image_folder)
+            log.debug("Using fallback image scanning (older image_processor)")
+            return self.image_processor.get_image_files(folder)
+    
+    def _poll_scan(self, future, folder: str, start_time: float, on_scanned) -> None:
+        """Check for a finished folder scan and finish loading on the Tk thread."""
+        if future is not self.scan_future:
+            return
+        
+        if not future.done():
+            self.scan_poll_timer = self.parent.after(
+                Defaults.LOAD_POLL_MS, self._poll_scan, future, folder, start_time, on_scanned)
+            return
         
-        scan_time = time.time() - start_time
+        self.scan_poll_timer = None
+        self.scan_future = None
         
+        # Ignore results for a folder that is no longer selected
+        if folder != self.data_manager.image_folder:
+            return
+        
+        try:
+            images = future.result()
+        except Exception as e:
+            log.exception("Error scanning folder %s", folder)
+            messagebox.showerror("Error", f"Failed to scan folder:\n{str(e)}")
+            return
+        
+        on_scanned(images, time.time() - start_time)
+    
+    def _finish_loading_images(self, images: list, scan_time: float) -> None:
+        """Initialize stats and UI for a completed folder scan."""
         if not images:
             messagebox.showerror("Error", "No images found in selected folder or its subfolders")
             return
         
-        print(f"File scan completed in {scan_time:.2f}s for {len(images)} images")
+        log.debug("File scan completed in %.2fs for %s images", scan_time, len(images))
         
         folder_name = os.path.basename(self.data_manager.image_folder)
         if self.folder_label:
@@ -95,34 +172,71 @@ class FolderManager:
         
         # Initialize image binner for voting controller - CRITICAL!
         if self.voting_controller:
-            print(f"Initializing image binner with folder: {self.data_manager.image_folder}")
+            log.debug("Initializing image binner with folder: %s", self.data_manager.image_folder)
             try:
                 self.voting_controller.set_image_folder(self.data_manager.image_folder)
-                print("Image binner initialization completed successfully")
-            except Exception as e:
-                print(f"Error during image binner initialization: {e}")
-                import traceback
-                traceback.print_exc()
+                log.debug("Image binner initialization completed successfully")
+            except Exception:
+                log.exception("Error during image binner initialization")
         else:
-            print("ERROR: Voting controller reference not set!")
+            log.error("Voting controller reference not set!")
         
-        if self.status_bar:
-            # Use compatible method calls
-            total_images = len(images)
-            if hasattr(self.data_manager, 'binned_images'):
-                binned_count = len(self.data_manager.binned_images)
-                active_count = total_images - binned_count
-            else:
-                active_count = total_images
-                binned_count = 0
-            
-            self.status_bar.config(
-                text=f"Loaded {len(images)} images. Active: {active_count}, Binned: {binned_count}. Ready to vote! (↓ to toggle bin mode)"
-            )
+        self._update_loaded_status(images)
+        
+        if self.on_load_complete_callback:
+            self.on_load_complete_callback(images)
+    
+    def refresh_loaded_images(self) -> None:
+        """
+        Re-attach freshly loaded data to a folder that is already loaded.
+        
+        Used when a save file points at the folder that is already loaded.
+        The folder is rescanned in the scan thread as in load_images(), but
+        only images missing from the loaded data are initialized and no
+        progress window is shown.
+        """
+        if not self.data_manager.image_folder:
+            return
+        
+        self._start_scan(self.data_manager.image_folder, self._finish_refreshing_images)
+    
+    def _finish_refreshing_images(self, images: list, scan_time: float) -> None:
+        """Attach a completed rescan of the loaded folder to freshly loaded data."""
+        if not images:
+            self._finish_loading_images(images, scan_time)
+            return
+        
+        log.debug("Folder rescan completed in %.2fs for %s images", scan_time, len(images))
+        
+        folder_name = os.path.basename(self.data_manager.image_folder)
+        if self.folder_label:
+            self.folder_label.config(text=f"Folder: {folder_name} ({len(images)} images including subfolders)")
+        
+        # Only images missing from the loaded data need fresh stats
+        image_stats = self.data_manager.image_stats
+        for img in images:
+            if img not in image_stats:
+                self.data_manager.initialize_image_stats(img)
+        
+        self.metadata_processor.start_background_extraction(images)
+        
+        if self.voting_controller:
+            self.voting_controller.set_image_folder(self.data_manager.image_folder)
+        
+        self._update_loaded_status(images)
         
         if self.on_load_complete_callback:
             self.on_load_complete_callback(images)
     
+    def _update_loaded_status(self, images: list) -> None:
+        """Show the loaded image counts in the status bar."""
+        active_count, binned_count = self.data_manager.get_counts()
+        self.loaded_status_text = (
+            f"Loaded {len(images)} images. Active: {active_count}, Binned: {binned_count}. Ready to vote! (↓ to toggle bin mode)"
+        )
+        if self.status_bar:
+            self.status_bar.config(text=self.loaded_status_text)
+    
     def _initialize_image_stats(self, images: list) -> None:
         """Initialize statistics for all images with strategic placement."""
         processed_count = 0
@@ -152,19 +266,12 @@ class FolderManager:
     def _on_metadata_complete(self, total_processed: int) -> None:
         """Handle metadata extraction completion."""
         if self.status_bar:
-            # Use compatible method calls
-            total_images = len(self.data_manager.image_stats)
-            if hasattr(self.data_manager, 'binned_images'):
-                binned_count = len(self.data_manager.binned_images)
-                active_count = total_images - binned_count
-            else:
-                active_count = total_images
-                binned_count = 0
+            active_count, binned_count = self.data_manager.get_counts()
             
             final_text = f"Metadata extraction complete for {total_processed} images. Active: {active_count}, Binned: {binned_count}. Ready to vote! (↓ to toggle bin mode)"
             self.status_bar.config(text=final_text)
         
-        print(f"Background metadata extraction completed for {total_processed} images")
+        log.debug("Background metadata extraction completed for %s images", total_processed)
     
     def _on_cancel_loading(self) -> None:
         """Handle loading cancellation."""
@@ -173,14 +280,14 @@ class FolderManager:
         if self.status_bar:
             self.status_bar.config(text="Loading cancelled")
         
-        print("Image loading cancelled")
+        log.debug("Image loading cancelled")
     
     def load_from_file(self, filename: str) -> bool:
         """Load ranking data from file and reload images."""
         success, error_msg = self.data_manager.load_from_file(filename)
         if success:
             if self.data_manager.image_folder:
-                print(f"Reloading images from saved folder: {self.data_manager.image_folder}")
+                log.debug("Reloading images from saved folder: %s", self.data_manager.image_folder)
                 self.load_images()  # This will now properly initialize the image binner
             
             left_weights = self.data_manager.get_left_weights()
@@ -192,13 +299,7 @@ class FolderManager:
                 weights_message = "\n\nUsing same weights for both left and right selection."
             
             # Include binning information in success message
-            total_images = len(self.data_manager.image_stats)
-            if hasattr(self.data_manager, 'binned_images'):
-                binned_count = len(self.data_manager.binned_images)
-                active_count = total_images - binned_count
-            else:
-                active_count = total_images
-                binned_count = 0
+            active_count, binned_count = self.data_manager.get_counts()
             
             binning_message = f"\n\nLoaded {active_count} active images and {binned_count} binned images."
             
@@ -232,5 +333,11 @@ class FolderManager:
     
     def cleanup(self) -> None:
         """Clean up resources."""
+        if self.scan_poll_timer:
+            self.parent.after_cancel(self.scan_poll_timer)
+            self.scan_poll_timer = None
+        self.scan_future = None
+        self.scan_executor.shutdown(wait=False, cancel_futures=True)
+        
         self.metadata_processor.cancel_extraction()
         self.progress_tracker.close_progress_window()
@@ -8,10 +8,14 @@ and updating image information in the UI, including tier-based color theming.
 import tkinter as tk
 import os
 import gc
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple
 
 from config import Colors, Defaults
 
+# Metadata label wraplength used before the label has been laid out
+DEFAULT_WRAPLENGTH = 400
+
 
 class ImageDisplayController:
     """
@@ -21,6 +25,10 @@ class ImageDisplayController:
     including image loading, resizing, metadata display, and tier-based color theming.
     """
     
+    _PROMPT_PREFIX = "Prompt: "
+    _EMPTY_PROMPT_TEXT = _PROMPT_PREFIX + "(empty or unreadable)"
+    _NO_PROMPT_TEXT = _PROMPT_PREFIX + "No prompt found"
+    
     def __init__(self, parent: tk.Tk, data_manager, image_processor, prompt_analyzer):
         """
         Initialize the image display controller.
@@ -54,6 +62,10 @@ class ImageDisplayController:
         # Preloaded images for better performance
         self.next_pair_images = {'left': None, 'right': None}
         
+        # Pairs decoded ahead of display: (filename, (max_width, max_height)) -> Future
+        self.decode_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="decode")
+        self.decoded_images = {}
+        
         # Timer reference for resize handling
         self.resize_timer = None
         
@@ -139,13 +151,13 @@ class ImageDisplayController:
         Bind click handlers to the image labels.
         
         Args:
-            left_callback: Function to call when left image is clicked
-            right_callback: Function to call when right image is clicked
+            left_callback: Function to call when left image is clicked (receives the Tk event)
+            right_callback: Function to call when right image is clicked (receives the Tk event)
         """
         if self.left_image_label:
-            self.left_image_label.bind("<Button-1>", lambda e: left_callback())
+            self.left_image_label.bind("<Button-1>", left_callback)
         if self.right_image_label:
-            self.right_image_label.bind("<Button-1>", lambda e: right_callback())
+            self.right_image_label.bind("<Button-1>", right_callback)
     
     def _get_tier_colors(self, tier: int) -> Dict[str, str]:
         """
@@ -210,11 +222,11 @@ class ImageDisplayController:
                 if not current_image or current_image == '':
                     # No image, safe to change background
                     image_label.config(bg=colors['image_bg'])
-            except:
+            except tk.TclError:
                 # If there's any error, just update the background
                 try:
                     image_label.config(bg=colors['image_bg'])
-                except:
+                except tk.TclError:
                     pass
         
         if info_label:
@@ -243,27 +255,20 @@ class ImageDisplayController:
             # Force window to update and get actual dimensions
             self.parent.update_idletasks()
             
-            # Get the actual size of the image label area after layout
-            if side == 'left':
-                label_width = self.left_image_label.winfo_width()
-                label_height = self.left_image_label.winfo_height()
-            else:
-                label_width = self.right_image_label.winfo_width()
-                label_height = self.right_image_label.winfo_height()
-            
-            # Only proceed if we have valid dimensions (widget has been rendered)
-            if label_width <= 1 or label_height <= 1:
+            size = self._get_max_image_size(side)
+            if size is None:
                 # Widget not yet rendered, try again after a short delay
                 self.parent.after(100, lambda: self.display_image(filename, side))
                 return
             
-            # Use almost all available space, leaving small margin, but with reasonable minimums
-            max_image_width = max(label_width - 20, 300)
-            max_image_height = max(label_height - 20, 300)
-            
-            # Load and resize image to fill the available space
-            photo = self.image_processor.load_and_resize_image(
-                img_path, max_image_width, max_image_height)
+            future = self.decoded_images.pop((filename, size), None)
+            if future is not None:
+                # Decoded by prefetch_images(); only waits if still running
+                img = future.result()
+                photo = self.image_processor.to_photo_image(img) if img is not None else None
+            else:
+                # Load and resize image to fill the available space
+                photo = self.image_processor.load_and_resize_image(img_path, *size)
             
             if photo:
                 # Update image display
@@ -284,6 +289,44 @@ class ImageDisplayController:
             print(f"Error displaying image {filename}: {e}")
             self._handle_image_load_error(filename, side)
     
+    def _get_max_image_size(self, side: str) -> Optional[Tuple[int, int]]:
+        """Return the image size that fills a side's label, or None before it is laid out."""
+        label = self.left_image_label if side == 'left' else self.right_image_label
+        if label is None:
+            return None
+        
+        label_width = label.winfo_width()
+        label_height = label.winfo_height()
+        if label_width <= 1 or label_height <= 1:
+            return None
+        
+        # Use almost all available space, leaving small margin, but with reasonable minimums
+        return max(label_width - 20, 300), max(label_height - 20, 300)
+    
+    def prefetch_images(self, img1: str, img2: str) -> list:
+        """
+        Start decoding a pair in the decode threads at the size display_image() uses.
+        
+        Args:
+            img1: Image filename for the left side
+            img2: Image filename for the right side
+            
+        Returns:
+            The pending futures; empty if the labels are not laid out yet
+        """
+        self.parent.update_idletasks()
+        sizes = (self._get_max_image_size('left'), self._get_max_image_size('right'))
+        if None in sizes:
+            return []
+        
+        decode = self.image_processor.open_resized_image
+        self.decoded_images = {
+            (filename, size): self.decode_executor.submit(
+                decode, os.path.join(self.data_manager.image_folder, filename), *size)
+            for filename, size in zip((img1, img2), sizes)
+        }
+        return list(self.decoded_images.values())
+    
     def update_image_info(self, filename: str, side: str) -> None:
         """
         Update the info and metadata labels for an image.
@@ -309,11 +352,13 @@ class ImageDisplayController:
         
         # Create info text with selection method indication
         selection_indicator = "(Low confidence)" if side == 'left' else "(High confidence, low recency)"
-        info_text = (f"{tier_indicator} | "
-                    f"Wins: {stats.get('wins', 0)} | "
-                    f"Losses: {stats.get('losses', 0)} | "
-                    f"Stability: {stability:.2f} | "
-                    f"Confidence: {confidence:.2f} {selection_indicator}")
+        info_text = " | ".join((
+            tier_indicator,
+            f"Wins: {stats.get('wins', 0)}",
+            f"Losses: {stats.get('losses', 0)}",
+            f"Stability: {stability:.2f}",
+            f"Confidence: {confidence:.2f} {selection_indicator}",
+        ))
         
         # Get prompt with lazy loading
         prompt = stats.get('prompt')
@@ -333,32 +378,29 @@ class ImageDisplayController:
         if prompt:
             # Extract only the main/positive prompt using the prompt analyzer
             main_prompt = self.prompt_analyzer.extract_main_prompt(prompt)
-            if main_prompt:
-                prompt_text = f"Prompt: {main_prompt}"
-            else:
-                prompt_text = "Prompt: (empty or unreadable)"
+            prompt_text = self._PROMPT_PREFIX + main_prompt if main_prompt else self._EMPTY_PROMPT_TEXT
         else:
-            prompt_text = "Prompt: No prompt found"
+            prompt_text = self._NO_PROMPT_TEXT
         
         # Update labels with dynamic wraplength
         if side == 'left':
-            self.left_info_label.config(text=info_text)
+            self.left_info_label.configure(text=info_text)
             self._update_metadata_label(self.left_metadata_label, prompt_text)
         else:
-            self.right_info_label.config(text=info_text)
+            self.right_info_label.configure(text=info_text)
             self._update_metadata_label(self.right_metadata_label, prompt_text)
     
     def _update_metadata_label(self, label: tk.Label, text: str) -> None:
-        """Update a metadata label with proper text wrapping."""
+        """Update a metadata label with proper text wrapping in a single configure call."""
+        wraplength = DEFAULT_WRAPLENGTH
         try:
             self.parent.update_idletasks()
             frame_width = label.winfo_width()
             if frame_width > 100:  # Only update if frame has been rendered
-                label.config(text=text, wraplength=max(frame_width - 20, 300))
-            else:
-                label.config(text=text, wraplength=400)
-        except:
-            label.config(text=text, wraplength=400)
+                wraplength = max(frame_width - 20, 300)
+        except tk.TclError:
+            pass
+        label.configure(text=text, wraplength=wraplength)
     
     def _handle_image_load_error(self, filename: str, side: str) -> None:
         """Handle image loading errors by updating UI appropriately."""
@@ -451,5 +493,8 @@ class ImageDisplayController:
         if self.resize_timer:
             self.parent.after_cancel(self.resize_timer)
         
+        self.decoded_images = {}
+        self.decode_executor.shutdown(wait=False, cancel_futures=True)
+        
         # Clear all image references
         self.clear_images()
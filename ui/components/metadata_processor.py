@@ -5,11 +5,16 @@ This module handles background metadata extraction and processing
 for large image collections.
 """
 
+import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Set
 import os
 
+from config import Defaults
+
+log = logging.getLogger(__name__)
+
 
 class MetadataProcessor:
     """
@@ -30,8 +35,11 @@ class MetadataProcessor:
         self.data_manager = data_manager
         self.image_processor = image_processor
         
-        # Background processing
-        self.metadata_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="metadata")
+        # Background processing - sized for disk I/O rather than CPU count
+        self.metadata_executor = ThreadPoolExecutor(
+            max_workers=Defaults.METADATA_WORKERS,
+            thread_name_prefix="meta"
+        )
         self.metadata_futures = {}  # Track background metadata extraction
         self.loading_cancelled = False
         
@@ -74,12 +82,12 @@ class MetadataProcessor:
                 images_needing_metadata.append(img)
         
         if not images_needing_metadata:
-            print("No images need metadata extraction")
+            log.debug("No images need metadata extraction")
             if self.on_complete_callback:
                 self.on_complete_callback(0)
             return
         
-        print(f"Starting background metadata extraction for {len(images_needing_metadata)} images")
+        log.debug("Starting background metadata extraction for %s images", len(images_needing_metadata))
         
         # Submit metadata extraction tasks
         for img in images_needing_metadata:
@@ -110,7 +118,7 @@ class MetadataProcessor:
             return img_filename, prompt, metadata
             
         except Exception as e:
-            print(f"Error extracting metadata from {img_filename}: {e}")
+            log.warning("Error extracting metadata from %s: %s", img_filename, e)
             return img_filename, None, None
     
     def collect_metadata_results(self) -> None:
@@ -124,20 +132,20 @@ class MetadataProcessor:
                 
             try:
                 img_filename, prompt, metadata = future.result()
+                completed_count += 1
                 
-                # Update data manager
+                # Apply each result straight away so prompts show up as soon as
+                # they are extracted, instead of being extracted again on demand
                 self.data_manager.set_image_metadata(img_filename, prompt, metadata)
                 
-                completed_count += 1
-                
                 # Update progress periodically
                 if completed_count % 50 == 0 or completed_count == total_count:
                     if self.on_progress_callback:
                         progress_message = f"Background metadata extraction: {completed_count}/{total_count} completed"
                         self.on_progress_callback(completed_count, total_count, progress_message)
                     
-            except Exception as e:
-                print(f"Error collecting metadata result: {e}")
+            except Exception:
+                log.exception("Error collecting metadata result")
         
         # Clear futures dict
         self.metadata_futures.clear()
@@ -179,7 +187,7 @@ class MetadataProcessor:
             return prompt, metadata
             
         except Exception as e:
-            print(f"Error extracting metadata for {img_filename}: {e}")
+            log.warning("Error extracting metadata for %s: %s", img_filename, e)
             return None, f"Error: {str(e)}"
     
     def cancel_extraction(self) -> None:
@@ -191,7 +199,7 @@ class MetadataProcessor:
             future.cancel()
         self.metadata_futures.clear()
         
-        print("Metadata extraction cancelled")
+        log.debug("Metadata extraction cancelled")
     
     def is_processing(self) -> bool:
         """
@@ -223,5 +231,5 @@ class MetadataProcessor:
         # Cancel any ongoing extraction
         self.cancel_extraction()
         
-        # Shutdown the executor
-        self.metadata_executor.shutdown(wait=False)
+        # Shutdown the executor, dropping any extraction work still queued
+        self.metadata_executor.shutdown(wait=False, cancel_futures=True)
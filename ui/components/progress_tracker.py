@@ -46,16 +46,14 @@ class ProgressTracker:
         
         self.progress_window = tk.Toplevel(self.parent)
         self.progress_window.title(title)
-        self.progress_window.geometry("400x150")
-        self.progress_window.configure(bg=Colors.BG_PRIMARY)
-        self.progress_window.transient(self.parent)
-        self.progress_window.grab_set()
-        
-        # Center the window
-        self.progress_window.geometry("+%d+%d" % (
+        # Size and offset from the main window in one geometry call
+        self.progress_window.geometry("400x150+%d+%d" % (
             self.parent.winfo_rootx() + 200,
             self.parent.winfo_rooty() + 200
         ))
+        self.progress_window.configure(bg=Colors.BG_PRIMARY)
+        self.progress_window.transient(self.parent)
+        self.progress_window.grab_set()
         
         # Progress label
         self.progress_label_var = tk.StringVar(value="Starting...")
@@ -151,16 +149,14 @@ class ProgressTracker:
         
         self.progress_window = tk.Toplevel(self.parent)
         self.progress_window.title(title)
-        self.progress_window.geometry("400x120")
-        self.progress_window.configure(bg=Colors.BG_PRIMARY)
-        self.progress_window.transient(self.parent)
-        self.progress_window.grab_set()
-        
-        # Center the window
-        self.progress_window.geometry("+%d+%d" % (
+        # Size and offset from the main window in one geometry call
+        self.progress_window.geometry("400x120+%d+%d" % (
             self.parent.winfo_rootx() + 200,
             self.parent.winfo_rooty() + 200
         ))
+        self.progress_window.configure(bg=Colors.BG_PRIMARY)
+        self.progress_window.transient(self.parent)
+        self.progress_window.grab_set()
         
         # Message label
         label = tk.Label(self.progress_window, text=message,
@@ -108,7 +108,7 @@ class PromptAnalyzerUI:
         self.search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=15,
                                     bg=Colors.BG_TERTIARY, fg=Colors.TEXT_PRIMARY)
         self.search_entry.pack(side=tk.LEFT, padx=(5, 5))
-        self.search_entry.bind('<Return>', lambda e: self.refresh_analysis())
+        self.search_entry.bind('<Return>', self.refresh_analysis)
         
         search_button = tk.Button(search_frame, text="Search", command=self.refresh_analysis,
                                  bg=Colors.BUTTON_SECONDARY, fg='white', relief=tk.FLAT)
@@ -172,7 +172,7 @@ class PromptAnalyzerUI:
         self.word_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         word_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
-    def refresh_analysis(self):
+    def refresh_analysis(self, event=None):
         """Refresh the enhanced prompt analysis display with binning data."""
         if not self.word_tree:
             return
@@ -182,8 +182,7 @@ class PromptAnalyzerUI:
             self.word_tree.delete(item)
         
         # Check if we have any prompt data
-        prompt_count = sum(1 for stats in self.data_manager.image_stats.values() 
-                          if stats.get('prompt'))
+        prompt_count = self.data_manager.prompt_count
         
         if prompt_count == 0:
             # Show message if no prompt data
@@ -298,7 +297,7 @@ class PromptAnalyzerUI:
             # Show error to user
             try:
                 messagebox.showerror("Prompt Analysis Error", f"Failed to refresh prompt analysis:\n{str(e)}")
-            except:
+            except tk.TclError:
                 pass
             
             # Add error row to table
@@ -306,7 +305,7 @@ class PromptAnalyzerUI:
                 self.word_tree.insert('', tk.END, values=(
                     "CRITICAL ERROR", "Failed", "Failed", "Failed", "Failed", "Failed", str(e)
                 ))
-            except:
+            except tk.TclError:
                 pass
     
     def sort_by_column(self, column):
@@ -547,7 +546,7 @@ class PromptAnalyzerUI:
             try:
                 for item in self.word_tree.get_children():
                     self.word_tree.delete(item)
-            except:
+            except tk.TclError:
                 pass
             
             # Clear callbacks
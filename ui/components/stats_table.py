@@ -253,7 +253,7 @@ class StatsTable:
             # Show error to user
             try:
                 messagebox.showerror("Statistics Error", f"Failed to populate statistics table:\n{str(e)}")
-            except:
+            except tk.TclError:
                 pass
             
             # Add error row to table
@@ -261,7 +261,7 @@ class StatsTable:
                 self.stats_tree.insert('', tk.END, values=(
                     "ERROR", "Failed to load", "", "", "", "", "", "", "", "", str(e)
                 ))
-            except:
+            except tk.TclError:
                 pass
     
     def sort_by_column(self, column):
@@ -548,7 +548,7 @@ class StatsTable:
                 # Clear all items
                 for item in self.stats_tree.get_children():
                     self.stats_tree.delete(item)
-            except:
+            except tk.TclError:
                 pass
             
             # Clear callbacks
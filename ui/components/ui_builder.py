@@ -31,7 +31,9 @@ class UIBuilder:
         # UI references to return
         self.folder_label = None
         self.stats_label = None
+        self.stats_var = None
         self.status_bar = None
+        self.ui_references = {}  # Built once by build_main_ui()
         
         # Setup dark theme
         self._setup_dark_theme()
@@ -42,7 +44,7 @@ class UIBuilder:
         
         try:
             style.theme_use('clam')  # clam theme works better for customization
-        except:
+        except tk.TclError:
             pass
         
         # Configure Treeview for dark mode
@@ -86,13 +88,15 @@ class UIBuilder:
         main_frame = self._create_main_frame()
         self._create_status_bar()
         
-        return {
+        self.ui_references = {
             'top_frame': top_frame,
             'main_frame': main_frame,
             'folder_label': self.folder_label,
             'stats_label': self.stats_label,
+            'stats_var': self.stats_var,
             'status_bar': self.status_bar
         }
+        return self.ui_references
     
     def _create_top_frame(self) -> tk.Frame:
         """Create the top frame with buttons and status information."""
@@ -104,7 +108,9 @@ class UIBuilder:
                                    fg=Colors.TEXT_SECONDARY, bg=Colors.BG_PRIMARY)
         self.folder_label.pack(side=tk.LEFT, padx=20)
         
-        self.stats_label = tk.Label(top_frame, text="Total votes: 0", 
+        # Stats text is updated on every vote, so it is driven by a StringVar
+        self.stats_var = tk.StringVar(value="Total votes: 0")
+        self.stats_label = tk.Label(top_frame, textvariable=self.stats_var, 
                                   font=('Arial', 10, 'bold'), 
                                   fg=Colors.TEXT_PRIMARY, bg=Colors.BG_PRIMARY)
         self.stats_label.pack(side=tk.RIGHT, padx=10)
@@ -200,10 +206,6 @@ class UIBuilder:
         Get references to important UI elements.
         
         Returns:
-            Dictionary containing UI element references
+            The dictionary built by build_main_ui(); empty before it runs
         """
-        return {
-            'folder_label': self.folder_label,
-            'stats_label': self.stats_label,
-            'status_bar': self.status_bar
-        }
+        return self.ui_references
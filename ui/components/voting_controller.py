@@ -1,18 +1,33 @@
 """Voting controller for the Image Ranking System with binning support and debug logging."""
 
+import logging
 import tkinter as tk
 from tkinter import messagebox
 from typing import Optional, Tuple
 
-from config import Colors, Defaults
+from config import Colors, Defaults, KeyBindings
 from core.image_binner import ImageBinner
 
+log = logging.getLogger(__name__)
+
 
 class VotingController:
     """Handles voting logic and pair management for the main interface."""
     
+    # (key sequence, handler method name), flattened once when the class is created
+    SHORTCUT_ACTIONS = tuple(
+        (key, name)
+        for keys, name in (
+            (KeyBindings.VOTE_LEFT, '_on_vote_left_key'),
+            (KeyBindings.VOTE_RIGHT, '_on_vote_right_key'),
+            (KeyBindings.BIN_LOSER, 'prepare_to_bin_next_loser'),  # Toggle bin mode for next vote
+            (KeyBindings.BIN_LAST_LOSER, 'bin_last_loser'),  # Bin last loser retroactively
+        )
+        for key in keys
+    )
+    
     def __init__(self, parent: tk.Tk, data_manager, ranking_algorithm, image_processor, image_display):
-        print("VotingController: Initializing...")
+        log.debug("Initializing...")
         self.parent = parent
         self.data_manager = data_manager
         self.ranking_algorithm = ranking_algorithm
@@ -29,8 +44,14 @@ class VotingController:
         self.right_vote_button = None
         self.status_bar = None
         self.stats_label = None
+        self.stats_var = None
         
         self.preload_timer = None
+        self.next_pair_timer = None
+        self.prefetch_timer = None
+        self.pending_pair = None  # Pair being decoded by prefetch_next_pair()
+        self.stats_display_timer = None  # Pending idle refresh of the stats label
+        self.last_stats_text = None  # Text last written to stats_var
         
         self.on_vote_callback = None
         
@@ -39,15 +60,15 @@ class VotingController:
         
         # Filter manager - will be set by main window
         self.filter_manager = None
-        print("VotingController: Initialization complete")
+        log.debug("Initialization complete")
     
     def create_vote_buttons(self, left_frame: tk.Frame, right_frame: tk.Frame) -> None:
         """Create vote buttons for both sides."""
-        print("VotingController: Creating vote buttons...")
+        log.debug("Creating vote buttons...")
         self.left_vote_button = tk.Button(
             left_frame, 
             text="Vote for this image (←)", 
-            command=lambda: self.vote('left'), 
+            command=self.vote_left, 
             state=tk.DISABLED, 
             font=('Arial', 12, 'bold'),
             bg=Colors.BUTTON_SUCCESS, 
@@ -60,7 +81,7 @@ class VotingController:
         self.right_vote_button = tk.Button(
             right_frame, 
             text="Vote for this image (→)", 
-            command=lambda: self.vote('right'), 
+            command=self.vote_right, 
             state=tk.DISABLED, 
             font=('Arial', 12, 'bold'),
             bg=Colors.BUTTON_SUCCESS, 
@@ -70,18 +91,16 @@ class VotingController:
         )
         self.right_vote_button.grid(row=3, column=0, sticky="ew", padx=10, pady=10)
         
-        self.image_display.bind_click_handlers(
-            lambda: self.vote('left'),
-            lambda: self.vote('right')
-        )
-        print("VotingController: Vote buttons created successfully")
+        self.image_display.bind_click_handlers(self.vote_left, self.vote_right)
+        log.debug("Vote buttons created successfully")
     
-    def set_ui_references(self, status_bar: tk.Label, stats_label: tk.Label) -> None:
+    def set_ui_references(self, status_bar: tk.Label, stats_label: tk.Label, stats_var: tk.StringVar) -> None:
         """Set references to UI elements that need to be updated."""
-        print("VotingController: Setting UI references...")
+        log.debug("Setting UI references...")
         self.status_bar = status_bar
         self.stats_label = stats_label
-        print("VotingController: UI references set")
+        self.stats_var = stats_var
+        log.debug("UI references set")
     
     def set_vote_callback(self, callback) -> None:
         """Set callback function to be called after each vote."""
@@ -89,53 +108,51 @@ class VotingController:
     
     def set_filter_manager(self, filter_manager) -> None:
         """Set the filter manager for prompt-based filtering."""
-        print("VotingController: Setting filter manager...")
+        log.debug("Setting filter manager...")
         self.filter_manager = filter_manager
-        print("VotingController: Filter manager set")
+        log.debug("Filter manager set")
     
     def set_image_folder(self, folder_path: str) -> None:
         """Set the image folder and initialize the binner."""
-        print(f"VotingController: set_image_folder called with: {folder_path}")
+        log.debug("set_image_folder called with: %s", folder_path)
         try:
             if not folder_path:
-                print("VotingController: ERROR - Empty folder path received")
+                log.error("Empty folder path received")
                 return
             
             self.image_binner = ImageBinner(folder_path)
-            print(f"VotingController: Image binner initialized successfully for folder: {folder_path}")
+            log.debug("Image binner initialized successfully for folder: %s", folder_path)
             
             # Test if binner is working
             bin_folder_exists = self.image_binner.ensure_bin_folder_exists()
-            print(f"VotingController: Bin folder creation test: {bin_folder_exists}")
+            log.debug("Bin folder creation test: %s", bin_folder_exists)
             
-        except Exception as e:
-            print(f"VotingController: ERROR initializing image binner: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error initializing image binner")
             self.image_binner = None
     
-    def prepare_to_bin_next_loser(self) -> None:
+    def prepare_to_bin_next_loser(self, event=None) -> None:
         """
         Set flag to bin the loser of the next vote.
         Called by the down arrow key.
         """
-        print("VotingController: prepare_to_bin_next_loser called")
+        log.debug("prepare_to_bin_next_loser called")
         
         if not self.current_pair[0] or not self.current_pair[1]:
-            print("VotingController: No current pair available")
+            log.debug("No current pair available")
             if self.status_bar:
                 self.status_bar.config(text="No images available - load images first")
             return
         
         if not self.image_binner:
-            print("VotingController: ERROR - Image binner not initialized")
+            log.error("Image binner not initialized")
             if self.status_bar:
                 self.status_bar.config(text="Error: Image binner not initialized - select a folder first")
             return
         
         # Toggle bin mode
         self.bin_next_loser = not self.bin_next_loser
-        print(f"VotingController: Bin mode toggled to: {self.bin_next_loser}")
+        log.debug("Bin mode toggled to: %s", self.bin_next_loser)
         
         if self.bin_next_loser:
             if self.status_bar:
@@ -147,7 +164,7 @@ class VotingController:
             if self.right_vote_button:
                 self.right_vote_button.config(text="Vote for this image (→ + BIN)", bg=Colors.BUTTON_WARNING)
             
-            print("VotingController: Bin mode enabled - next loser will be binned")
+            log.debug("Bin mode enabled - next loser will be binned")
         else:
             if self.status_bar:
                 self.status_bar.config(text="Bin mode cancelled - voting normally")
@@ -158,73 +175,47 @@ class VotingController:
             if self.right_vote_button:
                 self.right_vote_button.config(text="Vote for this image (→)", bg=Colors.BUTTON_SUCCESS)
             
-            print("VotingController: Bin mode disabled")
+            log.debug("Bin mode disabled")
     
-    def bin_last_loser(self) -> None:
+    def bin_last_loser(self, event=None) -> None:
         """
         Bin the loser from the last vote. This can be called after a normal vote.
         """
-        print("VotingController: bin_last_loser called")
+        log.debug("bin_last_loser called")
         
         if not self.last_vote_result:
-            print("VotingController: No last vote result available")
+            log.debug("No last vote result available")
             if self.status_bar:
                 self.status_bar.config(text="No recent vote to bin from - vote first, then press B to bin the loser")
             return
         
         if not self.image_binner:
-            print("VotingController: ERROR - Image binner not initialized")
+            log.error("Image binner not initialized")
             if self.status_bar:
                 self.status_bar.config(text="Error: Image binner not initialized - select a folder first")
             return
         
         winner, loser = self.last_vote_result
-        print(f"VotingController: Attempting to bin last loser: {loser} (winner was: {winner})")
+        log.debug("Attempting to bin last loser: %s (winner was: %s)", loser, winner)
         
-        # Check if already binned (compatible with existing data manager)
-        if hasattr(self.data_manager, 'is_image_binned'):
-            if self.data_manager.is_image_binned(loser):
-                print(f"VotingController: {loser} is already binned")
-                if self.status_bar:
-                    self.status_bar.config(text=f"{loser} is already binned")
-                return
-        elif hasattr(self.data_manager, 'binned_images'):
-            if loser in self.data_manager.binned_images:
-                print(f"VotingController: {loser} is already binned")
-                if self.status_bar:
-                    self.status_bar.config(text=f"{loser} is already binned")
-                return
+        if self.data_manager.is_image_binned(loser):
+            log.debug("%s is already binned", loser)
+            if self.status_bar:
+                self.status_bar.config(text=f"{loser} is already binned")
+            return
         
-        # Bin the loser (compatible with existing data manager)
-        success = False
-        if hasattr(self.data_manager, 'bin_image'):
-            success = self.data_manager.bin_image(loser)
-            print(f"VotingController: data_manager.bin_image result: {success}")
-        elif hasattr(self.data_manager, 'binned_images'):
-            if loser not in self.data_manager.binned_images:
-                self.data_manager.binned_images.add(loser)
-                success = True
-                print(f"VotingController: Added {loser} to binned_images set")
-        else:
-            # Create binned_images set if it doesn't exist
-            if not hasattr(self.data_manager, 'binned_images'):
-                self.data_manager.binned_images = set()
-                print("VotingController: Created new binned_images set")
-            self.data_manager.binned_images.add(loser)
-            success = True
-            print(f"VotingController: Added {loser} to new binned_images set")
+        success = self.data_manager.bin_image(loser)
+        log.debug("data_manager.bin_image result: %s", success)
         
         if success:
             # Purge votes involving the binned image from all active images
-            purge_result = None
-            if hasattr(self.data_manager, 'purge_binned_image_votes'):
-                purge_result = self.data_manager.purge_binned_image_votes(loser)
-                print(f"VotingController: Vote purge result: {purge_result}")
+            purge_result = self.data_manager.purge_binned_image_votes(loser)
+            log.debug("Vote purge result: %s", purge_result)
             
             # Move the physical file
-            print(f"VotingController: Attempting to move file {loser} to bin")
+            log.debug("Attempting to move file %s to bin", loser)
             move_success, error_msg = self.image_binner.move_image_to_bin(loser)
-            print(f"VotingController: File move result: {move_success}, error: {error_msg}")
+            log.debug("File move result: %s, error: %s", move_success, error_msg)
             
             if move_success:
                 # Update UI
@@ -239,27 +230,32 @@ class VotingController:
                         text=f"Binned: {loser} moved to Bin folder (last loser vs {winner}){purge_info}"
                     )
                 
-                print(f"VotingController: Successfully binned last loser: {loser}")
+                log.debug("Successfully binned last loser: %s", loser)
             else:
                 # File move failed - remove from binned set
-                if hasattr(self.data_manager, 'binned_images'):
-                    self.data_manager.binned_images.discard(loser)
-                    print(f"VotingController: Removed {loser} from binned set due to file move failure")
+                self.data_manager.unbin_image(loser)
+                log.debug("Removed %s from binned set due to file move failure", loser)
                 if self.status_bar:
                     self.status_bar.config(text=f"Error binning image: {error_msg}")
-                print(f"VotingController: Failed to bin image: {error_msg}")
+                log.warning("Failed to bin image: %s", error_msg)
         else:
-            print("VotingController: Failed to mark image as binned")
+            log.warning("Failed to mark image as binned")
             if self.status_bar:
                 self.status_bar.config(text="Failed to bin image")
     
     def _update_stats_display(self):
+        """Schedule a stats display refresh; repeated calls before it runs share it."""
+        if self.stats_display_timer is None:
+            self.stats_display_timer = self.parent.after_idle(self.refresh_stats_display)
+    
+    def refresh_stats_display(self):
         """Update stats display — shows zone progress when cutline is active."""
-        if not self.stats_label:
+        if self.stats_display_timer:
+            self.parent.after_cancel(self.stats_display_timer)
+            self.stats_display_timer = None
+        if not self.stats_var:
             return
         try:
-            active_count = self.data_manager.get_active_image_count()
-            binned_count = self.data_manager.get_binned_image_count()
             votes        = self.data_manager.vote_count
             target_count = self.data_manager.algorithm_settings.target_count
 
@@ -269,57 +265,50 @@ class VotingController:
                 ct      = summary.get('cutline_tier')
                 ct_str  = f"Tier {ct}" if ct is not None else "—"
                 res     = summary.get('resolution_pct', 0.0)
-                self.stats_label.config(
-                    text=(
-                        f"Votes: {votes}  |  "
-                        f"✓ In: {summary['confirmed_in']}  "
-                        f"~ Boundary: {summary['boundary']}  "
-                        f"✗ Out: {summary['confirmed_out']}  "
-                        f"Binned: {summary['eliminated']}  |  "
-                        f"Cutline: {ct_str} (target {target_count})  |  "
-                        f"Resolution: {res:.0f}%"
-                    )
+                text = Defaults.CUTLINE_STATS_LABEL_FORMAT % (
+                    votes, summary['confirmed_in'], summary['boundary'],
+                    summary['confirmed_out'], summary['eliminated'],
+                    ct_str, target_count, res,
                 )
             else:
                 # Disabled: existing display
-                self.stats_label.config(
-                    text=f"Votes: {votes} | Active: {active_count} | Binned: {binned_count}"
-                )
-        except Exception as e:
-            print(f"VotingController: Error updating stats display: {e}")
+                active_count, binned_count = self.data_manager.get_counts()
+                text = Defaults.STATS_LABEL_FORMAT % (votes, active_count, binned_count)
+            
+            # Only touch the Tcl variable when the text actually changes
+            if text != self.last_stats_text:
+                self.last_stats_text = text
+                self.stats_var.set(text)
+        except Exception:
+            log.exception("Error updating stats display")
     
-    def show_next_pair(self) -> None:
-        """Display the next pair of images for voting."""
+    def show_next_pair(self, pair: Optional[Tuple[str, str]] = None) -> None:
+        """
+        Display the next pair of images for voting.
+        
+        Args:
+            pair: Pair already chosen by prefetch_next_pair(); selected here if omitted
+        """
         if self.data_manager.image_folder == "":
             return
         
         if self.left_vote_button is None or self.right_vote_button is None:
-            print("Warning: Vote buttons not created yet")
-            return
-        
-        images = self.image_processor.get_image_files(self.data_manager.image_folder)
-        if len(images) < 2:
+            log.warning("Vote buttons not created yet")
             return
         
-        self.image_display.clear_images()
-        
-        if self.current_pair[0] and self.current_pair[1]:
-            self.previous_pair = self.current_pair
+        # Any prefetch still in flight is superseded by this pair
+        self.pending_pair = None
         
-        # Get images list for backwards compatibility
-        images = self.image_processor.get_image_files(self.data_manager.image_folder)
+        if pair is None:
+            pair = self._select_next_pair()
+            if pair is None:
+                return
+        img1, img2 = pair
         
-        # Pass filter_manager to ranking algorithm
-        img1, img2 = self.ranking_algorithm.select_next_pair(
-            available_images=images,
-            exclude_pair=self.previous_pair,
-            filter_manager=self.filter_manager
-        )
-        if not img1 or not img2:
-            return
+        self.image_display.clear_images()
         
         self.current_pair = (img1, img2)
-        print(f"VotingController: Showing new pair: {img1} vs {img2}")
+        log.debug("Showing new pair: %s vs %s", img1, img2)
         
         self.image_display.display_image(img1, 'left')
         self.image_display.display_image(img2, 'right')
@@ -332,7 +321,7 @@ class VotingController:
             # Keep bin mode appearance
             self.left_vote_button.config(text="Vote for this image (← + BIN)", bg=Colors.BUTTON_WARNING)
             self.right_vote_button.config(text="Vote for this image (→ + BIN)", bg=Colors.BUTTON_WARNING)
-            print("VotingController: Buttons set to bin mode appearance")
+            log.debug("Buttons set to bin mode appearance")
         else:
             # Normal appearance
             self.left_vote_button.config(text="Vote for this image (←)", bg=Colors.BUTTON_SUCCESS)
@@ -347,6 +336,64 @@ class VotingController:
         
         self.preload_timer = self.parent.after(Defaults.PRELOAD_DELAY_MS, self.preload_next_pair)
     
+    def _select_next_pair(self) -> Optional[Tuple[str, str]]:
+        """Choose the next pair to show, or None if no pair is available."""
+        images = self.image_processor.get_image_files(self.data_manager.image_folder)
+        if len(images) < 2:
+            return None
+        
+        if self.current_pair[0] and self.current_pair[1]:
+            self.previous_pair = self.current_pair
+        
+        # Pass filter_manager to ranking algorithm
+        img1, img2 = self.ranking_algorithm.select_next_pair(
+            available_images=images,
+            exclude_pair=self.previous_pair,
+            filter_manager=self.filter_manager
+        )
+        if not img1 or not img2:
+            return None
+        return img1, img2
+    
+    def prefetch_next_pair(self) -> None:
+        """
+        Choose the next pair and show it once both images are decoded.
+        
+        Decoding runs in the image display's decode threads, so the window
+        keeps handling events meanwhile. Falls back to show_next_pair() when
+        the image labels have not been laid out yet.
+        """
+        if self.data_manager.image_folder == "":
+            return
+        
+        pair = self._select_next_pair()
+        if pair is None:
+            return
+        
+        futures = self.image_display.prefetch_images(*pair)
+        if not futures:
+            self.show_next_pair(pair)
+            return
+        
+        self.pending_pair = pair
+        self._poll_prefetch(pair, futures)
+    
+    def _poll_prefetch(self, pair: Tuple[str, str], futures: list) -> None:
+        """Show a prefetched pair when its decodes finish, unless it was superseded."""
+        self.prefetch_timer = None
+        if pair is not self.pending_pair:
+            return
+        
+        if not all(future.done() for future in futures):
+            self.prefetch_timer = self.parent.after(
+                Defaults.LOAD_POLL_MS, self._poll_prefetch, pair, futures)
+            return
+        
+        try:
+            self.show_next_pair(pair)
+        except Exception:
+            log.exception("Error showing prefetched pair")
+    
     def preload_next_pair(self) -> None:
         """Preload the next pair of images in the background."""
         if self.data_manager.image_folder == "":
@@ -368,29 +415,29 @@ class VotingController:
     
     def vote(self, side: str) -> None:
         """Process a vote for the specified side, with optional binning."""
-        print(f"VotingController: Vote called for side: {side}")
+        log.debug("Vote called for side: %s", side)
         
         if not self.current_pair[0] or not self.current_pair[1]:
-            print("VotingController: No current pair available for voting")
+            log.debug("No current pair available for voting")
             return
         
         if self.left_vote_button is None or self.right_vote_button is None:
-            print("Warning: Vote buttons not created yet")
+            log.warning("Vote buttons not created yet")
             return
         
         winner = self.current_pair[0] if side == 'left' else self.current_pair[1]
         loser = self.current_pair[1] if side == 'left' else self.current_pair[0]
-        print(f"VotingController: Winner: {winner}, Loser: {loser}")
+        log.debug("Winner: %s, Loser: %s", winner, loser)
         
         self.data_manager.record_vote(winner, loser)
         
         # Store vote result for potential binning
         self.last_vote_result = (winner, loser)
-        print(f"VotingController: Vote recorded and stored for potential binning")
+        log.debug("Vote recorded and stored for potential binning")
         
         # Handle binning if bin mode is enabled
         if self.bin_next_loser:
-            print("VotingController: Bin mode is enabled, binning loser immediately")
+            log.debug("Bin mode is enabled, binning loser immediately")
             self._bin_loser_immediately(winner, loser)
             self.bin_next_loser = False  # Reset bin mode
             
@@ -399,7 +446,7 @@ class VotingController:
                 self.left_vote_button.config(text="Vote for this image (←)", bg=Colors.BUTTON_SUCCESS)
             if self.right_vote_button:
                 self.right_vote_button.config(text="Vote for this image (→)", bg=Colors.BUTTON_SUCCESS)
-            print("VotingController: Bin mode reset after use")
+            log.debug("Bin mode reset after use")
         else:
             # Normal vote without binning
             self._update_stats_display()
@@ -413,56 +460,46 @@ class VotingController:
         if self.on_vote_callback:
             self.on_vote_callback(winner, loser)
         
-        self.parent.after(Defaults.VOTE_DELAY_MS, self.show_next_pair)
+        # Only the most recently scheduled pair change should fire
+        if self.next_pair_timer:
+            self.parent.after_cancel(self.next_pair_timer)
+        
+        self.next_pair_timer = self.parent.after(Defaults.VOTE_DELAY_MS, self._show_scheduled_pair)
+    
+    def _show_scheduled_pair(self) -> None:
+        """Show the next pair once the post-vote delay has elapsed."""
+        self.next_pair_timer = None
+        self.show_next_pair()
     
     def _bin_loser_immediately(self, winner: str, loser: str) -> None:
         """Bin the loser immediately after a vote."""
-        print(f"VotingController: _bin_loser_immediately called for {loser}")
+        log.debug("_bin_loser_immediately called for %s", loser)
         
         if not self.image_binner:
-            print("VotingController: ERROR - Image binner not initialized")
+            log.error("Image binner not initialized")
             if self.status_bar:
                 self.status_bar.config(text="Error: Image binner not initialized")
             return
         
-        # Bin the loser (compatible with existing data manager)
-        success = False
-        if hasattr(self.data_manager, 'bin_image'):
-            success = self.data_manager.bin_image(loser)
-            print(f"VotingController: data_manager.bin_image result: {success}")
-        elif hasattr(self.data_manager, 'binned_images'):
-            if not hasattr(self.data_manager.binned_images, '__contains__'):
-                self.data_manager.binned_images = set()
-            if loser not in self.data_manager.binned_images:
-                self.data_manager.binned_images.add(loser)
-                success = True
-                print(f"VotingController: Added {loser} to binned_images set")
-        else:
-            # Create binned_images set if it doesn't exist
-            if not hasattr(self.data_manager, 'binned_images'):
-                self.data_manager.binned_images = set()
-                print("VotingController: Created new binned_images set")
-            self.data_manager.binned_images.add(loser)
-            success = True
-            print(f"VotingController: Added {loser} to new binned_images set")
+        success = self.data_manager.bin_image(loser)
+        log.debug("data_manager.bin_image result: %s", success)
         
         if success:
             # Purge votes involving the binned image from all active images
-            if hasattr(self.data_manager, 'purge_binned_image_votes'):
-                purge_result = self.data_manager.purge_binned_image_votes(loser)
-                print(f"VotingController: Vote purge result: {purge_result}")
+            purge_result = self.data_manager.purge_binned_image_votes(loser)
+            log.debug("Vote purge result: %s", purge_result)
             
             # Move the physical file
-            print(f"VotingController: Attempting to move file {loser} to bin")
+            log.debug("Attempting to move file %s to bin", loser)
             move_success, error_msg = self.image_binner.move_image_to_bin(loser)
-            print(f"VotingController: File move result: {move_success}, error: {error_msg}")
+            log.debug("File move result: %s, error: %s", move_success, error_msg)
             
             if move_success:
                 # Update UI
                 self._update_stats_display()
                 
                 purge_info = ""
-                if hasattr(self.data_manager, 'purge_binned_image_votes') and purge_result:
+                if purge_result:
                     purge_info = f" | Purged {purge_result['total_votes_removed']} vote(s) from {purge_result['affected_images']} image(s)"
                 
                 if self.status_bar:
@@ -470,17 +507,16 @@ class VotingController:
                         text=f"Vote + Bin: {winner} beats {loser} → {loser} binned{purge_info}"
                     )
                 
-                print(f"VotingController: Vote and bin successful: {winner} beats {loser}, {loser} binned")
+                log.debug("Vote and bin successful: %s beats %s, %s binned", winner, loser, loser)
             else:
                 # File move failed - remove from binned set
-                if hasattr(self.data_manager, 'binned_images'):
-                    self.data_manager.binned_images.discard(loser)
-                    print(f"VotingController: Removed {loser} from binned set due to file move failure")
+                self.data_manager.unbin_image(loser)
+                log.debug("Removed %s from binned set due to file move failure", loser)
                 if self.status_bar:
                     self.status_bar.config(text=f"Vote recorded but binning failed: {error_msg}")
-                print(f"VotingController: Vote succeeded but binning failed: {error_msg}")
+                log.warning("Vote succeeded but binning failed: %s", error_msg)
         else:
-            print("VotingController: Failed to mark image as binned")
+            log.warning("Failed to mark image as binned")
             if self.status_bar:
                 self.status_bar.config(text=f"Vote recorded but {loser} was already binned")
     
@@ -492,39 +528,39 @@ class VotingController:
     
     def setup_keyboard_shortcuts(self) -> None:
         """Setup keyboard shortcuts for voting and binning."""
-        print("VotingController: Setting up keyboard shortcuts...")
-        
-        # Hardcoded key bindings to avoid import issues
-        VOTE_LEFT = ['<Left>', '<a>']
-        VOTE_RIGHT = ['<Right>', '<d>']
-        BIN_LOSER = ['<Down>']
-        
-        for key in VOTE_LEFT:
-            self.parent.bind(key, lambda e: self.vote('left') if self.left_vote_button and self.left_vote_button['state'] == tk.NORMAL else None)
-            print(f"VotingController: Bound key {key} to vote left")
-        
-        for key in VOTE_RIGHT:
-            self.parent.bind(key, lambda e: self.vote('right') if self.right_vote_button and self.right_vote_button['state'] == tk.NORMAL else None)
-            print(f"VotingController: Bound key {key} to vote right")
+        log.debug("Setting up keyboard shortcuts...")
         
-        # Binning shortcut - toggle bin mode for next vote
-        for key in BIN_LOSER:
-            self.parent.bind(key, lambda e: self.prepare_to_bin_next_loser())
-            print(f"VotingController: Bound key {key} to prepare_to_bin_next_loser")
+        # Handlers take the Tk event directly, so each key binds a bound method
+        for key, name in self.SHORTCUT_ACTIONS:
+            self.parent.bind(key, getattr(self, name))
         
-        # Alternative binning keys - bin last loser retroactively
-        self.parent.bind('<b>', lambda e: self.bin_last_loser())
-        self.parent.bind('<B>', lambda e: self.bin_last_loser())
-        print("VotingController: Bound B/b keys to bin_last_loser")
-        
-        print("VotingController: Keyboard shortcuts setup complete")
+        log.debug("Keyboard shortcuts setup complete")
+    
+    def vote_left(self, event=None) -> None:
+        """Vote for the left image (button command and image click handler)."""
+        self.vote('left')
+    
+    def vote_right(self, event=None) -> None:
+        """Vote for the right image (button command and image click handler)."""
+        self.vote('right')
+    
+    def _on_vote_left_key(self, event=None) -> None:
+        """Vote left from the keyboard if the left vote button is enabled."""
+        if self.left_vote_button and self.left_vote_button['state'] == tk.NORMAL:
+            self.vote('left')
+    
+    def _on_vote_right_key(self, event=None) -> None:
+        """Vote right from the keyboard if the right vote button is enabled."""
+        if self.right_vote_button and self.right_vote_button['state'] == tk.NORMAL:
+            self.vote('right')
     
     def reset_voting_state(self) -> None:
         """Reset voting state when loading new images."""
-        print("VotingController: Resetting voting state...")
+        log.debug("Resetting voting state...")
         self.current_pair = (None, None)
         self.next_pair = (None, None)
         self.previous_pair = (None, None)
+        self.pending_pair = None
         self.last_vote_result = None
         self.bin_next_loser = False  # Reset bin mode
         
@@ -536,13 +572,22 @@ class VotingController:
         if self.status_bar:
             self.status_bar.config(text="Select a folder to begin")
         
-        print("VotingController: Voting state reset complete")
+        log.debug("Voting state reset complete")
     
     def cleanup(self) -> None:
         """Clean up resources."""
-        print("VotingController: Cleaning up...")
+        log.debug("Cleaning up...")
         if self.preload_timer:
             self.parent.after_cancel(self.preload_timer)
+        if self.next_pair_timer:
+            self.parent.after_cancel(self.next_pair_timer)
+            self.next_pair_timer = None
+        if self.prefetch_timer:
+            self.parent.after_cancel(self.prefetch_timer)
+            self.prefetch_timer = None
+        if self.stats_display_timer:
+            self.parent.after_cancel(self.stats_display_timer)
+            self.stats_display_timer = None
         
         self.reset_voting_state()
-        print("VotingController: Cleanup complete")
+        log.debug("Cleanup complete")
@@ -137,7 +137,7 @@ class WordCombinationAnalyzerUI:
         synergy_combo = ttk.Combobox(controls_frame, textvariable=self.synergy_filter_var, 
                                     values=synergy_options, state="readonly", width=18)
         synergy_combo.pack(side=tk.LEFT, padx=5)
-        synergy_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_combination_analysis())
+        synergy_combo.bind('<<ComboboxSelected>>', self.refresh_combination_analysis)
         
         # Minimum frequency filter
         tk.Label(controls_frame, text="Min Frequency:", font=('Arial', 10, 'bold'), 
@@ -204,7 +204,7 @@ class WordCombinationAnalyzerUI:
         self.combination_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
-    def refresh_combination_analysis(self):
+    def refresh_combination_analysis(self, event=None):
         """Refresh the combination analysis display."""
         if not self.combination_tree:
             return
@@ -310,7 +310,7 @@ class WordCombinationAnalyzerUI:
             try:
                 messagebox.showerror("Combination Analysis Error", 
                                    f"Failed to refresh combination analysis:\n{str(e)}")
-            except:
+            except tk.TclError:
                 pass
             
             # Add error row to table
@@ -319,7 +319,7 @@ class WordCombinationAnalyzerUI:
                     "CRITICAL ERROR", "Failed", "Failed", "Failed", "Failed", 
                     "Failed", "Failed", str(e)
                 ))
-            except:
+            except tk.TclError:
                 pass
     
     def sort_by_column(self, column):
@@ -554,7 +554,7 @@ class WordCombinationAnalyzerUI:
             try:
                 for item in self.combination_tree.get_children():
                     self.combination_tree.delete(item)
-            except:
+            except tk.TclError:
                 pass
             
             # Clear callbacks
@@ -4,7 +4,10 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 import sys
 import os
-import traceback
+import importlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from config import Colors, Defaults, KeyBindings
 from core.data_manager import DataManager
@@ -21,78 +24,153 @@ from ui.components.folder_manager import FolderManager
 from ui.components.ui_builder import UIBuilder
 from ui.components.filter_ui import FilterUI
 
-from ui.stats_window import StatsWindow
-from ui.settings_window import SettingsWindow
+# StatsWindow and SettingsWindow pull in the chart, table and analysis modules;
+# they are imported on first use so they stay off the startup path.
+
+log = logging.getLogger(__name__)
 
 
 class MainWindow:
     """Main application window coordinating all components."""
     
+    # Fixed attribute set; the vote and filter callbacks read these on every event
+    __slots__ = (
+        'root', 'data_manager', 'image_processor', 'ranking_algorithm',
+        'prompt_analyzer', 'filter_manager', 'ui_builder', 'progress_tracker',
+        'metadata_processor', 'folder_manager', 'image_display', 'voting_controller',
+        'filter_ui', 'ui_refs', 'status_bar', 'stats_var', 'stats_window', 'settings_window',
+        'stats_refresh_timer', '_filter_refresh_pending', 'io_executor',
+        '_voting_tree_ready',
+    )
+    
+    # Control button key (see UIBuilder.create_control_buttons) -> handler method name
+    BUTTON_ACTIONS = {
+        'select_folder': 'select_folder',
+        'save_data': 'save_data',
+        'load_data': 'load_data',
+        'purge_binned_votes': 'purge_binned_votes',
+        'show_stats': 'show_detailed_stats',
+        'show_prompt_analysis': 'show_prompt_analysis',
+        'show_settings': 'show_settings',
+    }
+    
+    # (key sequence, handler method name), flattened once when the class is created
+    SHORTCUT_ACTIONS = tuple(
+        (key, name)
+        for keys, name in (
+            (KeyBindings.SAVE, 'save_data'),
+            (KeyBindings.LOAD, 'load_data'),
+            (KeyBindings.STATS, 'show_detailed_stats'),
+            (KeyBindings.PROMPT_ANALYSIS, 'show_prompt_analysis'),
+            (KeyBindings.SETTINGS, 'show_settings'),
+        )
+        for key in keys
+    )
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         
         # Initialize core components with error handling
         try:
-            print("MainWindow: Initializing core components...")
+            log.debug("Initializing core components...")
             self.data_manager = DataManager()
             self.image_processor = ImageProcessor()
             self.ranking_algorithm = RankingAlgorithm(self.data_manager)
             self.prompt_analyzer = PromptAnalyzer(self.data_manager)
             self.filter_manager = FilterManager(self.data_manager, self.prompt_analyzer)
-            print("MainWindow: Core components initialized successfully")
+            log.debug("Core components initialized successfully")
         except Exception as e:
-            print(f"MainWindow: Error initializing core components: {e}")
+            log.exception("Error initializing core components")
             messagebox.showerror("Initialization Error", f"Failed to initialize core components:\n{str(e)}")
             sys.exit(1)
         
         # Initialize UI components with error handling
         try:
-            print("MainWindow: Initializing UI components...")
+            log.debug("Initializing UI components...")
             self.ui_builder = UIBuilder(root)
             self.progress_tracker = ProgressTracker(root)
             self.metadata_processor = MetadataProcessor(self.data_manager, self.image_processor)
             self.folder_manager = FolderManager(
+                root,
                 self.data_manager, 
                 self.image_processor, 
                 self.metadata_processor, 
                 self.progress_tracker
             )
-            print("MainWindow: UI components initialized successfully")
+            log.debug("UI components initialized successfully")
         except Exception as e:
-            print(f"MainWindow: Error initializing UI components: {e}")
+            log.exception("Error initializing UI components")
             messagebox.showerror("UI Initialization Error", f"Failed to initialize UI components:\n{str(e)}")
             sys.exit(1)
         
         self.image_display = None
         self.voting_controller = None
         self.filter_ui = None
+        self._voting_tree_ready = False
+        self.ui_refs = {}  # Widget references from UIBuilder, set once the main UI is built
+        self.status_bar = None
+        self.stats_var = None
         
         # Window references
         self.stats_window = None
         self.settings_window = None
+        self.stats_refresh_timer = None  # Coalesces stats refreshes during fast voting
+        self._filter_refresh_pending = False  # Coalesces filter edits into one pair refresh
+        
+        # Save/load file work runs here so the window keeps repainting
+        self.io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io")
         
         self._setup_application()
     
     def _setup_application(self) -> None:
         """Setup the complete application with comprehensive error handling."""
         try:
-            print("MainWindow: Starting application setup...")
+            log.debug("Starting application setup...")
             self.ui_builder.setup_window_properties()
             
             ui_refs = self.ui_builder.build_main_ui()
+            self.ui_refs = ui_refs
+            # Widgets updated on every load and vote are kept as attributes
+            self.status_bar = ui_refs['status_bar']
+            self.stats_var = ui_refs['stats_var']
             
-            button_callbacks = {
-                'select_folder': self.folder_manager.select_folder,
-                'save_data': self.save_data,
-                'load_data': self.load_data,
-                'purge_binned_votes': self.purge_binned_votes,
-                'show_stats': self.show_detailed_stats,
-                'show_prompt_analysis': self.show_prompt_analysis,
-                'show_settings': self.show_settings
-            }
+            button_callbacks = {key: getattr(self, name) for key, name in self.BUTTON_ACTIONS.items()}
             self.ui_builder.create_control_buttons(ui_refs['top_frame'], button_callbacks)
             
-            print("MainWindow: Creating image display controller...")
+            self.folder_manager.set_ui_references(ui_refs['folder_label'], ui_refs['status_bar'])
+            self.folder_manager.set_load_complete_callback(self._on_images_loaded)
+            
+            self._setup_additional_shortcuts()
+            
+            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+            
+            # Let the top bar paint first; the image and vote widgets follow
+            self.root.after(Defaults.VOTING_TREE_DELAY_MS, self._build_voting_tree)
+            prewarm = threading.Thread(target=self._prewarm_windows, daemon=True, name="prewarm")
+            self.root.after(Defaults.WINDOW_PREWARM_DELAY_MS, prewarm.start)
+            
+            log.debug("Application setup completed successfully")
+            
+        except Exception as e:
+            error_msg = f"Critical error during application setup: {e}"
+            log.exception(error_msg)
+            messagebox.showerror("Setup Error", f"Failed to setup application:\n{str(e)}\n\nSee console for details.")
+            sys.exit(1)
+    
+    def _build_voting_tree(self) -> None:
+        """
+        Build the filter, image display and voting widgets.
+        
+        Scheduled shortly after startup so the window opens before these are
+        built. Actions that need them call this first; later calls do nothing.
+        """
+        if self._voting_tree_ready:
+            return
+        
+        try:
+            ui_refs = self.ui_refs
+            
+            log.debug("Creating image display controller...")
             self.image_display = ImageDisplayController(
                 self.root, 
                 self.data_manager, 
@@ -105,13 +183,13 @@ class MainWindow:
             filter_container.pack(fill=tk.X, padx=5, pady=5)
             
             # Create filter UI in its own container
-            print("MainWindow: Creating filter UI...")
+            log.debug("Creating filter UI...")
             self.filter_ui = FilterUI(
                 filter_container,
                 self.filter_manager,
                 on_filter_change=self._on_filter_changed
             )
-            print("MainWindow: Filter UI created successfully")
+            log.debug("Filter UI created successfully")
             
             # Create a separate container for image display (uses grid)
             image_container = tk.Frame(ui_refs['main_frame'], bg='#2b2b2b')
@@ -119,9 +197,9 @@ class MainWindow:
             
             self.image_display.create_image_frames(image_container)
             self.image_display.set_ranking_algorithm(self.ranking_algorithm)
-            print("MainWindow: Image display controller created successfully")
+            log.debug("Image display controller created successfully")
             
-            print("MainWindow: Creating voting controller...")
+            log.debug("Creating voting controller...")
             self.voting_controller = VotingController(
                 self.root,
                 self.data_manager,
@@ -132,71 +210,70 @@ class MainWindow:
             
             left_frame, right_frame = self.image_display.get_frames()
             self.voting_controller.create_vote_buttons(left_frame, right_frame)
-            print("MainWindow: Voting controller created successfully")
+            log.debug("Voting controller created successfully")
             
             # FIXED: Set cross-references for binning functionality BEFORE any other operations
-            print("MainWindow: Setting up cross-references...")
+            log.debug("Setting up cross-references...")
             self.folder_manager.set_voting_controller_reference(self.voting_controller)
             
             # Set filter manager reference in voting controller
             self.voting_controller.set_filter_manager(self.filter_manager)
             
-            self.folder_manager.set_ui_references(ui_refs['folder_label'], ui_refs['status_bar'])
-            self.voting_controller.set_ui_references(ui_refs['status_bar'], ui_refs['stats_label'])
-            
-            self.folder_manager.set_load_complete_callback(self._on_images_loaded)
+            self.voting_controller.set_ui_references(ui_refs['status_bar'], ui_refs['stats_label'], ui_refs['stats_var'])
             self.voting_controller.set_vote_callback(self._on_vote_cast)
-            print("MainWindow: Cross-references set successfully")
+            log.debug("Cross-references set successfully")
             
-            print("MainWindow: Setting up keyboard shortcuts...")
             self.voting_controller.setup_keyboard_shortcuts()
-            self._setup_additional_shortcuts()
-            print("MainWindow: Keyboard shortcuts set up successfully")
             
-            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-            
-            print("MainWindow: Application setup completed successfully")
+            self._voting_tree_ready = True
+            log.debug("Voting widgets built successfully")
             
         except Exception as e:
             error_msg = f"Critical error during application setup: {e}"
-            print(error_msg)
-            print(traceback.format_exc())
+            log.exception(error_msg)
             messagebox.showerror("Setup Error", f"Failed to setup application:\n{str(e)}\n\nSee console for details.")
             sys.exit(1)
     
+    def _prewarm_windows(self) -> None:
+        """
+        Import the stats and settings window modules ahead of first use.
+        
+        Runs in a daemon thread: the imports (including matplotlib and numpy
+        for the charts) only fill sys.modules and create no widgets, so the
+        Tk thread never stalls on them. It stays off the I/O thread so saves
+        never queue behind it, and closing the app never waits for it. The
+        windows themselves are still created on demand, from the Tk thread.
+        """
+        try:
+            importlib.import_module('ui.stats_window')
+            importlib.import_module('ui.settings_window')
+            log.debug("Stats and settings window modules preloaded")
+        except Exception:
+            # Not fatal: the import is retried, and reported, on first use
+            log.debug("Preloading window modules failed", exc_info=True)
+    
+    def select_folder(self) -> None:
+        """Select an image folder, building the voting widgets first if needed."""
+        self._build_voting_tree()
+        self.folder_manager.select_folder()
+    
     def _setup_additional_shortcuts(self) -> None:
         """Setup additional keyboard shortcuts."""
         try:
-            for key in KeyBindings.SAVE:
-                self.root.bind(key, lambda e: self.save_data())
-            
-            for key in KeyBindings.LOAD:
-                self.root.bind(key, lambda e: self.load_data())
-            
-            for key in KeyBindings.STATS:
-                self.root.bind(key, lambda e: self.show_detailed_stats())
+            # Handlers accept the Tk event directly, so no wrapper lambdas are needed
+            for key, name in self.SHORTCUT_ACTIONS:
+                self.root.bind(key, getattr(self, name))
             
-            for key in KeyBindings.PROMPT_ANALYSIS:
-                self.root.bind(key, lambda e: self.show_prompt_analysis())
-            
-            for key in KeyBindings.SETTINGS:
-                self.root.bind(key, lambda e: self.show_settings())
-            
-            print("MainWindow: Keyboard shortcuts setup successfully")
-        except Exception as e:
-            print(f"MainWindow: Error setting up keyboard shortcuts: {e}")
+            log.debug("Keyboard shortcuts setup successfully")
+        except Exception:
+            log.exception("Error setting up keyboard shortcuts")
             # Non-critical error, continue
     
     def _on_images_loaded(self, images: list) -> None:
         """Handle completion of image loading."""
         try:
-            print(f"MainWindow: Images loaded callback - {len(images)} images")
-            ui_refs = self.ui_builder.get_ui_references()
-            active_count = self.data_manager.get_active_image_count()
-            binned_count = self.data_manager.get_binned_image_count()
-            ui_refs['stats_label'].config(
-                text=f"Votes: {self.data_manager.vote_count} | Active: {active_count} | Binned: {binned_count}"
-            )
+            log.debug("Images loaded callback - %s images", len(images))
+            self._update_stats_label()
             
             # FIXED: Verify that image binner is properly initialized
             binner_status = ""
@@ -205,41 +282,85 @@ class MainWindow:
                     binner_status = " | Binning: Ready"
                 else:
                     binner_status = " | Binning: Not initialized"
-                    print("MainWindow: WARNING - Image binner not initialized after loading images")
+                    log.warning("Image binner not initialized after loading images")
             else:
                 binner_status = " | Binning: Unavailable"
-                print("MainWindow: WARNING - Voting controller or image binner attribute missing")
+                log.warning("Voting controller or image binner attribute missing")
             
-            if 'status_bar' in ui_refs and ui_refs['status_bar']:
-                current_text = ui_refs['status_bar'].cget('text')
-                ui_refs['status_bar'].config(text=current_text + binner_status)
+            if self.status_bar:
+                # Extend the folder manager's status from its Python-side copy
+                # rather than reading the label text back from Tk
+                self.status_bar.config(text=self.folder_manager.loaded_status_text + binner_status)
             
             # Refresh filter UI after loading images
             if self.filter_ui:
                 self.filter_ui.refresh()
-                print("MainWindow: Filter UI refreshed after loading images")
+                log.debug("Filter UI refreshed after loading images")
             
-            self.voting_controller.show_next_pair()
+            # Let the labels above paint before the first pair is decoded
+            self.root.after_idle(self._show_first_pair)
             
-            print(f"MainWindow: Successfully loaded {len(images)} images (Active: {active_count}, Binned: {binned_count}){binner_status}")
+            log.debug("Successfully loaded %s images%s", len(images), binner_status)
         except Exception as e:
-            print(f"MainWindow: Error handling image load completion: {e}")
+            log.exception("Error handling image load completion")
             messagebox.showerror("Load Error", f"Error after loading images:\n{str(e)}")
     
+    def _show_first_pair(self) -> None:
+        """Show the first voting pair after a folder load, decoding it off the Tk thread."""
+        try:
+            self.voting_controller.prefetch_next_pair()
+        except Exception as e:
+            log.exception("Error showing first pair after load")
+            messagebox.showerror("Load Error", f"Error after loading images:\n{str(e)}")
+    
+    def _update_stats_label(self) -> None:
+        """Show the current vote and image counts in the stats label."""
+        # The voting controller owns the label text once it exists, so the
+        # per-vote and load-time updates share one format and one cache
+        if self.voting_controller:
+            self.voting_controller.refresh_stats_display()
+            return
+        
+        active_count, binned_count = self.data_manager.get_counts()
+        self.stats_var.set(Defaults.STATS_LABEL_FORMAT % (
+            self.data_manager.vote_count, active_count, binned_count))
+    
     def _on_vote_cast(self, winner: str, loser: str) -> None:
         """Handle vote being cast."""
         try:
-            # Refresh any open stats windows
-            if self.stats_window and hasattr(self.stats_window, 'refresh_stats'):
-                self.stats_window.refresh_stats()
-        except Exception as e:
-            print(f"MainWindow: Error handling vote cast: {e}")
+            # Refresh any open stats windows, once per burst of votes
+            if self.stats_window and self.stats_refresh_timer is None:
+                self.stats_refresh_timer = self.root.after(
+                    Defaults.STATS_REFRESH_DELAY_MS, self._refresh_stats_window)
+        except tk.TclError:
+            log.exception("Error handling vote cast")
             # Non-critical error, continue
     
+    def _refresh_stats_window(self) -> None:
+        """Run a scheduled stats window refresh."""
+        self.stats_refresh_timer = None
+        try:
+            if self.stats_window:
+                if self.stats_window.is_visible():
+                    self.stats_window.refresh_stats()
+                else:
+                    self.stats_window.needs_refresh = True
+        except Exception:
+            log.exception("Error refreshing stats window")
+    
     def _on_filter_changed(self) -> None:
-        """Handle filter changes."""
+        """Handle filter changes by scheduling a single refresh on the next idle tick."""
+        # Refreshing the filter UI can report another change; those are folded
+        # into the refresh that is already queued
+        if self._filter_refresh_pending:
+            return
+        self._filter_refresh_pending = True
+        self.root.after_idle(self._do_filter_refresh)
+    
+    def _do_filter_refresh(self) -> None:
+        """Refresh the voting pair and filter UI once for any queued filter changes."""
         try:
-            print("MainWindow: Filter changed, refreshing voting pair...")
+            log.debug("Filter changed, refreshing voting pair...")
             # Refresh the current image pair to respect new filters
             if self.voting_controller:
                 self.voting_controller.show_next_pair()
@@ -248,13 +369,21 @@ class MainWindow:
             if self.filter_ui:
                 self.filter_ui.refresh()
             
-            print("MainWindow: Filter change handled successfully")
-        except Exception as e:
-            print(f"MainWindow: Error handling filter change: {e}")
+            log.debug("Filter change handled successfully")
+        except Exception:
+            log.exception("Error handling filter change")
             # Non-critical error, continue
+        finally:
+            # Cleared last so changes reported by the refresh itself are not requeued
+            self._filter_refresh_pending = False
     
-    def save_data(self) -> None:
-        """Save ranking data to file with error handling."""
+    def save_data(self, event=None) -> None:
+        """
+        Save ranking data to file with error handling.
+        
+        Saves started from the keyboard shortcut (event is set) report success
+        in the status bar instead of a dialog; failures always show a dialog.
+        """
         try:
             if not self.data_manager.image_stats:
                 messagebox.showinfo("Info", "No data to save yet")
@@ -271,55 +400,72 @@ class MainWindow:
                 if self.filter_manager:
                     filter_state = self.filter_manager.export_state()
                 
-                # Get core data
-                serializable_stats = {}
-                for img_name, stats in self.data_manager.image_stats.items():
-                    stats_copy = stats.copy()
-                    if 'tested_against' in stats_copy:
-                        stats_copy['tested_against'] = list(stats_copy['tested_against'])
-                    serializable_stats[img_name] = stats_copy
+                # Copy the data here; the I/O thread only encodes and writes the copy,
+                # so votes and metadata extraction cannot change it mid-save
+                save_data = self.data_manager.snapshot_save_data(filter_state)
+                sync_state = self.data_manager.get_sync_state()
                 
-                core_data = {
-                    'image_folder': self.data_manager.image_folder,
-                    'vote_count': self.data_manager.vote_count,
-                    'image_stats': serializable_stats,
-                    'metadata_cache': self.data_manager.metadata_cache,
-                    'binned_images': list(self.data_manager.binned_images)
-                }
+                self.progress_tracker.show_indeterminate_progress(
+                    "Saving Data", f"Saving {os.path.basename(filename)}...", cancelable=False)
+                self._run_in_background(
+                    lambda: self.data_manager.write_save_data(filename, save_data),
+                    lambda future: self._on_save_finished(future, filename, sync_state, interactive=event is None)
+                )
+        except Exception as e:
+            log.exception("Error saving data")
+            messagebox.showerror("Save Error", f"Failed to save data:\n{str(e)}")
+    
+    def _on_save_finished(self, future, filename: str, sync_state: tuple, interactive: bool = True) -> None:
+        """Report the result of a background save."""
+        self.progress_tracker.close_progress_window()
+        try:
+            if future.result():
+                # Matched against the state the save was copied from, so changes
+                # made while it was being written still count as unsaved
+                self.data_manager.mark_file_synced(filename, sync_state)
+                active_count, binned_count = self.data_manager.get_counts()
                 
-                # Get other settings
-                weight_data = self.data_manager.weight_manager.export_to_data()
-                algorithm_settings = self.data_manager.algorithm_settings.export_settings()
+                if not interactive:
+                    self._show_transient_status(
+                        f"Saved {os.path.basename(filename)}: {active_count} active, {binned_count} binned images")
+                    return
                 
-                # Prepare complete save data with filter state
-                save_data = self.data_manager.data_persistence.prepare_save_data(
-                    core_data, weight_data, algorithm_settings, filter_state)
+                # Get filter stats for save message
+                filter_info = ""
+                if self.filter_manager and self.filter_manager.is_active():
+                    stats = self.filter_manager.get_filter_stats()
+                    filter_info = f"\n\nActive filters saved: {len(stats['include_words'])} include, {len(stats['exclude_words'])} exclude words."
                 
-                # Save to file
-                if self.data_manager.data_persistence.save_to_file(filename, save_data):
-                    active_count = self.data_manager.get_active_image_count()
-                    binned_count = self.data_manager.get_binned_image_count()
-                    
-                    # Get filter stats for save message
-                    filter_info = ""
-                    if self.filter_manager and self.filter_manager.is_active():
-                        stats = self.filter_manager.get_filter_stats()
-                        filter_info = f"\n\nActive filters saved: {len(stats['include_words'])} include, {len(stats['exclude_words'])} exclude words."
-                    
-                    # FIXED: Include binning status in save message
-                    binner_status = ""
-                    if self.voting_controller and hasattr(self.voting_controller, 'image_binner') and self.voting_controller.image_binner:
-                        binner_status = "\n\nBinning functionality is active and will be restored when loading this save."
-                    else:
-                        binner_status = "\n\nNote: Binning functionality was not active when saving."
-                    
-                    messagebox.showinfo("Success", f"Data saved to {filename}\n\nSaved {active_count} active images and {binned_count} binned images.{filter_info}{binner_status}")
+                # FIXED: Include binning status in save message
+                binner_status = ""
+                if self.voting_controller and hasattr(self.voting_controller, 'image_binner') and self.voting_controller.image_binner:
+                    binner_status = "\n\nBinning functionality is active and will be restored when loading this save."
                 else:
-                    messagebox.showerror("Error", "Failed to save data")
+                    binner_status = "\n\nNote: Binning functionality was not active when saving."
+                
+                messagebox.showinfo("Success", f"Data saved to {filename}\n\nSaved {active_count} active images and {binned_count} binned images.{filter_info}{binner_status}")
+            else:
+                messagebox.showerror("Error", "Failed to save data")
         except Exception as e:
-            print(f"MainWindow: Error saving data: {e}")
+            log.exception("Error saving data")
             messagebox.showerror("Save Error", f"Failed to save data:\n{str(e)}")
     
+    def _show_transient_status(self, text: str) -> None:
+        """Show text in the status bar, then put back what it replaced."""
+        if not self.status_bar:
+            return
+        previous = self.status_bar.cget('text')
+        self.status_bar.config(text=text)
+        self.root.after(Defaults.TRANSIENT_STATUS_MS, self._restore_status, text, previous)
+    
+    def _restore_status(self, shown: str, previous: str) -> None:
+        """Undo _show_transient_status unless something else updated the status since."""
+        try:
+            if self.status_bar.cget('text') == shown:
+                self.status_bar.config(text=previous)
+        except tk.TclError:
+            pass  # Window closed meanwhile
+    
     def purge_binned_votes(self) -> None:
         """Purge stale votes from all binned images in the currently loaded data."""
         try:
@@ -343,18 +489,14 @@ class MainWindow:
             if not confirm:
                 return
             
-            print(f"MainWindow: Starting vote purge for {binned_count} binned images...")
+            log.debug("Starting vote purge for %s binned images...", binned_count)
             result = self.data_manager.purge_all_binned_image_votes()
             
             # Update UI
-            ui_refs = self.ui_builder.get_ui_references()
-            active_count = self.data_manager.get_active_image_count()
-            ui_refs['stats_label'].config(
-                text=f"Votes: {self.data_manager.vote_count} | Active: {active_count} | Binned: {binned_count}"
-            )
+            self._update_stats_label()
             
-            if ui_refs.get('status_bar'):
-                ui_refs['status_bar'].config(
+            if self.status_bar:
+                self.status_bar.config(
                     text=f"Purge complete: {result['total_removed']} vote(s) removed from {result['total_affected']} image(s)"
                 )
             
@@ -373,21 +515,30 @@ class MainWindow:
                     f"All active images are already clean."
                 )
             
-            print(f"MainWindow: Vote purge completed: {result}")
+            log.debug("Vote purge completed: %s", result)
             
         except Exception as e:
-            print(f"MainWindow: Error purging binned votes: {e}")
+            log.exception("Error purging binned votes")
             messagebox.showerror("Purge Error", f"Failed to purge binned votes:\n{str(e)}")
     
-    def load_data(self) -> None:
+    def load_data(self, event=None) -> None:
         """Load ranking data from file with error handling."""
         try:
+            # Loading clears and refills the voting widgets, so they must exist
+            self._build_voting_tree()
+            
             filename = filedialog.askopenfilename(
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
             )
             
             if filename:
-                print(f"MainWindow: Loading data from {filename}")
+                if self.data_manager.is_file_unchanged_since_load(filename):
+                    log.debug("%s is unchanged since last load, skipping reload", filename)
+                    messagebox.showinfo("Load Data", "Using cached data - this file is already loaded and unchanged.")
+                    return
+                
+                log.debug("Loading data from %s", filename)
+                previous_folder = self.data_manager.image_folder
                 self.image_display.clear_images()
                 self.voting_controller.reset_voting_state()
                 
@@ -395,119 +546,155 @@ class MainWindow:
                 if self.voting_controller:
                     self.voting_controller.image_binner = None
                     self.voting_controller.image_folder_path = None
-                    print("MainWindow: Cleared existing image binner before loading")
+                    log.debug("Cleared existing image binner before loading")
+                
+                # Read and parse the file off the Tk thread
+                self.progress_tracker.show_indeterminate_progress(
+                    "Loading Data", f"Loading {os.path.basename(filename)}...", cancelable=False)
+                self._run_in_background(
+                    lambda: self._read_data_file(filename),
+                    lambda future: self._apply_loaded_data(future, filename, previous_folder)
+                )
+        except Exception as e:
+            log.exception("Error loading data")
+            messagebox.showerror("Load Error", f"Failed to load data:\n{str(e)}")
+    
+    def _read_data_file(self, filename: str) -> tuple:
+        """Read, validate and unpack a save file (runs in the I/O thread)."""
+        persistence = self.data_manager.data_persistence
+        success, data, error_msg = persistence.load_from_file(filename)
+        if not success:
+            return False, None, None, error_msg
+        
+        # Let the saved folder's scan overlap the rest of the unpacking
+        self.folder_manager.prefetch_folder(data.get('image_folder', ''))
+        
+        data = persistence.validate_and_fix_data(data)
+        return True, data, persistence.extract_core_data(data), ""
+    
+    def _apply_loaded_data(self, future, filename: str, previous_folder: str) -> None:
+        """Apply a parsed save file to the application (runs on the Tk thread)."""
+        self.progress_tracker.close_progress_window()
+        try:
+            success, data, core_data, error_msg = future.result()
+            
+            if success:
+                self.data_manager.image_folder = core_data['image_folder']
+                self.data_manager.vote_count = core_data['vote_count']
+                self.data_manager.image_stats = core_data['image_stats']
+                self.data_manager.metadata_cache = core_data['metadata_cache']
+                self.data_manager.binned_images = core_data['binned_images']
+                self.data_manager.invalidate_counts()
+                
+                # Start rescanning the folder right away; the scan runs in the background
+                # while the stats below are prepared, and the rest of the image load only
+                # continues on a later Tk tick, after this method returns.
+                folder = self.data_manager.image_folder
+                if folder and folder == previous_folder:
+                    # Already loaded: only images missing from the save need initializing
+                    log.debug("Rescanning already loaded folder: %s", folder)
+                    self.folder_manager.refresh_loaded_images()
+                elif folder:
+                    log.debug("Reloading images from saved folder: %s", folder)
+                    self.folder_manager.load_images()
                 
-                # Load data from file
-                success, data, error_msg = self.data_manager.data_persistence.load_from_file(filename)
+                # Convert tested_against lists back to sets and fill in missing fields
+                self.data_manager.normalize_loaded_stats()
                 
-                if success:
-                    # Validate and fix data
-                    data = self.data_manager.data_persistence.validate_and_fix_data(data)
-                    
-                    # Extract and load core data
-                    core_data = self.data_manager.data_persistence.extract_core_data(data)
-                    self.data_manager.image_folder = core_data['image_folder']
-                    self.data_manager.vote_count = core_data['vote_count']
-                    self.data_manager.image_stats = core_data['image_stats']
-                    self.data_manager.metadata_cache = core_data['metadata_cache']
-                    self.data_manager.binned_images = core_data['binned_images']
-                    
-                    # Convert tested_against lists back to sets
-                    for img_name, stats in self.data_manager.image_stats.items():
-                        if 'tested_against' in stats and isinstance(stats['tested_against'], list):
-                            stats['tested_against'] = set(stats['tested_against'])
-                        elif 'tested_against' not in stats:
-                            stats['tested_against'] = set()
-                    
-                    # Load other settings
-                    self.data_manager.weight_manager.load_from_data(data)
-                    self.data_manager.algorithm_settings.load_settings(data)
-                    
-                    # Load similarity cache if one exists for this folder
-                    if self.data_manager.image_folder:
-                        sm = self.data_manager.similarity_manager
-                        sm.load_cache(self.data_manager.image_folder)
-                    
-                    # Load filter state if present
-                    if 'filter_state' in data and self.filter_manager:
-                        print("MainWindow: Restoring filter state...")
-                        self.filter_manager.import_state(data['filter_state'])
-                        if self.filter_ui:
-                            self.filter_ui.refresh()
-                        print("MainWindow: Filter state restored")
-                    
-                    # Update existing images with strategic timing
-                    self.data_manager._update_existing_images_with_strategic_timing()
-                    
-                    # Initialize all image stats
-                    for image_filename in self.data_manager.image_stats:
-                        self.data_manager.initialize_image_stats(image_filename)
-                    
-                    # Now reload images from folder
-                    if self.data_manager.image_folder:
-                        print(f"MainWindow: Reloading images from saved folder: {self.data_manager.image_folder}")
-                        self.folder_manager.load_images()
-                    
-                    ui_refs = self.ui_builder.get_ui_references()
-                    active_count = self.data_manager.get_active_image_count()
-                    binned_count = self.data_manager.get_binned_image_count()
-                    ui_refs['stats_label'].config(
-                        text=f"Votes: {self.data_manager.vote_count} | Active: {active_count} | Binned: {binned_count}"
-                    )
-                    
-                    # Show filter info if filters were restored
-                    if 'filter_state' in data and self.filter_manager and self.filter_manager.is_active():
-                        filter_stats = self.filter_manager.get_filter_stats()
-                        print(f"MainWindow: Filters restored - {len(filter_stats['include_words'])} include, {len(filter_stats['exclude_words'])} exclude")
-                    
-                    # Report similarity index status and auto-index if needed
+                # Load other settings
+                self.data_manager.weight_manager.load_from_data(data)
+                self.data_manager.algorithm_settings.load_settings(data)
+                
+                # Load similarity cache if one exists for this folder
+                if self.data_manager.image_folder:
                     sm = self.data_manager.similarity_manager
-                    all_images = list(self.data_manager.image_stats.keys())
-                    folder = self.data_manager.image_folder
-                    ui_refs = self.ui_builder.get_ui_references()
-
-                    if sm.is_ready and not getattr(sm, 'is_legacy', False):
-                        missing = sm.count_missing(all_images)
-                        if missing == 0:
-                            sim_msg = (f"Similarity index loaded "
-                                       f"({len(sm.filenames)} embeddings — all images covered).")
-                            print(f"MainWindow: {sim_msg}")
-                            if ui_refs.get('status_bar'):
-                                ui_refs['status_bar'].config(text=sim_msg)
-                        else:
-                            sim_msg = (f"Similarity index loaded ({len(sm.filenames)} embeddings) — "
-                                       f"{missing} new image(s) found, updating index in background…")
-                            print(f"MainWindow: {sim_msg}")
-                            if ui_refs.get('status_bar'):
-                                ui_refs['status_bar'].config(text=sim_msg)
-                            self._auto_update_similarity_index(folder, all_images)
-                    elif sm.is_ready and getattr(sm, 'is_legacy', False):
-                        sim_msg = (f"Legacy similarity index found ({len(sm.filenames)} visual-only embeddings) — "
-                                   f"upgrading to full hybrid index in background…")
-                        print(f"MainWindow: {sim_msg}")
-                        if ui_refs.get('status_bar'):
-                            ui_refs['status_bar'].config(text=sim_msg)
-                        self._auto_build_similarity_index(folder, all_images)
+                    sm.load_cache(self.data_manager.image_folder)
+                
+                # Load filter state if present
+                if 'filter_state' in data and self.filter_manager:
+                    log.debug("Restoring filter state...")
+                    self.filter_manager.import_state(data['filter_state'])
+                    if self.filter_ui:
+                        self.filter_ui.refresh()
+                    log.debug("Filter state restored")
+                
+                # Update existing images with strategic timing
+                self.data_manager._update_existing_images_with_strategic_timing()
+                
+                self._update_stats_label()
+                
+                # Show filter info if filters were restored
+                if 'filter_state' in data and self.filter_manager and self.filter_manager.is_active():
+                    filter_stats = self.filter_manager.get_filter_stats()
+                    log.debug("Filters restored - %s include, %s exclude", len(filter_stats['include_words']), len(filter_stats['exclude_words']))
+                
+                # Report similarity index status and auto-index if needed
+                sm = self.data_manager.similarity_manager
+                all_images = list(self.data_manager.image_stats.keys())
+                folder = self.data_manager.image_folder
+                
+                if sm.is_ready and not getattr(sm, 'is_legacy', False):
+                    missing = sm.count_missing(all_images)
+                    if missing == 0:
+                        sim_msg = (f"Similarity index loaded "
+                                   f"({len(sm.filenames)} embeddings — all images covered).")
+                        log.debug("%s", sim_msg)
+                        if self.status_bar:
+                            self.status_bar.config(text=sim_msg)
                     else:
-                        sim_msg = (f"No similarity index found — "
-                                   f"building index for {len(all_images)} images in background…")
-                        print(f"MainWindow: {sim_msg}")
-                        if ui_refs.get('status_bar'):
-                            ui_refs['status_bar'].config(text=sim_msg)
-                        self._auto_build_similarity_index(folder, all_images)
-                    
-                    print(f"MainWindow: Data loaded successfully")
+                        sim_msg = (f"Similarity index loaded ({len(sm.filenames)} embeddings) — "
+                                   f"{missing} new image(s) found, updating index in background…")
+                        log.debug("%s", sim_msg)
+                        if self.status_bar:
+                            self.status_bar.config(text=sim_msg)
+                        self._auto_update_similarity_index(folder, all_images)
+                elif sm.is_ready and getattr(sm, 'is_legacy', False):
+                    sim_msg = (f"Legacy similarity index found ({len(sm.filenames)} visual-only embeddings) — "
+                               f"upgrading to full hybrid index in background…")
+                    log.debug("%s", sim_msg)
+                    if self.status_bar:
+                        self.status_bar.config(text=sim_msg)
+                    self._auto_build_similarity_index(folder, all_images)
                 else:
-                    print(f"MainWindow: Failed to load data from {filename}: {error_msg}")
+                    sim_msg = (f"No similarity index found — "
+                               f"building index for {len(all_images)} images in background…")
+                    log.debug("%s", sim_msg)
+                    if self.status_bar:
+                        self.status_bar.config(text=sim_msg)
+                    self._auto_build_similarity_index(folder, all_images)
+                
+                self.data_manager.mark_file_synced(filename)
+                log.debug("Data loaded successfully")
+            else:
+                log.error("Failed to load data from %s: %s", filename, error_msg)
+                messagebox.showerror("Load Error", f"Failed to load data:\n{error_msg}")
         except Exception as e:
-            print(f"MainWindow: Error loading data: {e}")
+            log.exception("Error loading data")
             messagebox.showerror("Load Error", f"Failed to load data:\n{str(e)}")
     
+    def _run_in_background(self, work, on_done) -> None:
+        """
+        Run blocking file work in the I/O thread.
+        
+        Args:
+            work: Callable run in the worker thread
+            on_done: Called on the Tk thread with the finished future
+        """
+        future = self.io_executor.submit(work)
+        self._poll_background(future, on_done)
+    
+    def _poll_background(self, future, on_done) -> None:
+        """Wait for a background job without blocking the Tk event loop."""
+        if future.done():
+            on_done(future)
+        else:
+            self.root.after(Defaults.LOAD_POLL_MS, self._poll_background, future, on_done)
+    
+    
     def _auto_build_similarity_index(self, folder: str, image_names: list) -> None:
         """Kick off a full similarity index build in the background (no UI prompts)."""
         sm = self.data_manager.similarity_manager
-        ui_refs = self.ui_builder.get_ui_references()
-        status_bar = ui_refs.get('status_bar')
+        status_bar = self.status_bar
 
         prompt_lookup = {
             name: (self.data_manager.image_stats.get(name, {}).get('prompt') or '')
@@ -519,12 +706,12 @@ class MainWindow:
                 pct = int(current / max(total, 1) * 100)
                 msg = (f"Building similarity index: {current}/{total} ({pct}%)…"
                        if name != "done" else "")
-                print(f"[SimilarityManager] {msg}")
+                log.debug("[SimilarityManager] %s", msg)
                 if status_bar:
                     self.root.after(0, lambda m=msg: status_bar.config(text=m) if m else None)
 
         def completion(success, message):
-            print(f"[SimilarityManager] Auto-build complete: {message}")
+            log.debug("[SimilarityManager] Auto-build complete: %s", message)
             if status_bar:
                 final = (f"✅ Similarity index built ({len(sm.filenames)} embeddings). "
                          f"Visual similarity pairing is now active."
@@ -537,8 +724,7 @@ class MainWindow:
     def _auto_update_similarity_index(self, folder: str, image_names: list) -> None:
         """Kick off an incremental index update in the background (no UI prompts)."""
         sm = self.data_manager.similarity_manager
-        ui_refs = self.ui_builder.get_ui_references()
-        status_bar = ui_refs.get('status_bar')
+        status_bar = self.status_bar
 
         prompt_lookup = {
             name: (self.data_manager.image_stats.get(name, {}).get('prompt') or '')
@@ -550,12 +736,12 @@ class MainWindow:
                 pct = int(current / max(total, 1) * 100)
                 msg = (f"Updating similarity index: {current}/{total} ({pct}%)…"
                        if name != "done" else "")
-                print(f"[SimilarityManager] {msg}")
+                log.debug("[SimilarityManager] %s", msg)
                 if status_bar:
                     self.root.after(0, lambda m=msg: status_bar.config(text=m) if m else None)
 
         def completion(success, message):
-            print(f"[SimilarityManager] Auto-update complete: {message}")
+            log.debug("[SimilarityManager] Auto-update complete: %s", message)
             if status_bar:
                 final = (f"✅ Similarity index updated ({len(sm.filenames)} embeddings total). "
                          f"Visual similarity pairing is now active."
@@ -565,85 +751,71 @@ class MainWindow:
 
         sm.update_index_async(folder, image_names, prompt_lookup, progress, completion)
 
-    def show_detailed_stats(self) -> None:
+    def show_detailed_stats(self, event=None) -> None:
         """Show the detailed statistics window with error handling."""
         try:
             if not self.data_manager.image_stats:
                 messagebox.showinfo("No Data", "No image data to display. Please load images first.")
                 return
             
-            if self.stats_window is None:
-                print("MainWindow: Creating new stats window...")
-                self.stats_window = StatsWindow(
-                    self.root, 
-                    self.data_manager, 
-                    self.ranking_algorithm, 
-                    self.prompt_analyzer
-                )
-                print("MainWindow: Stats window created successfully")
-            else:
-                print("MainWindow: Showing existing stats window...")
-                self.stats_window.show()
+            self._get_stats_window().show()
         except Exception as e:
             error_msg = f"Error showing statistics window: {e}"
-            print(error_msg)
-            print(traceback.format_exc())
+            log.exception(error_msg)
             messagebox.showerror("Statistics Error", f"Failed to show statistics window:\n{str(e)}\n\nSee console for details.")
             # Reset the stats window in case it's corrupted
             self.stats_window = None
     
-    def show_prompt_analysis(self) -> None:
+    def _get_stats_window(self):
+        """Return the stats window object, creating it (but not its widgets) on first use."""
+        if self.stats_window is None:
+            log.debug("Creating stats window...")
+            from ui.stats_window import StatsWindow
+            self.stats_window = StatsWindow(
+                self.root, 
+                self.data_manager, 
+                self.ranking_algorithm, 
+                self.prompt_analyzer
+            )
+        return self.stats_window
+    
+    def show_prompt_analysis(self, event=None) -> None:
         """Show the prompt analysis functionality with error handling."""
         try:
             if not self.data_manager.image_stats:
                 messagebox.showinfo("No Data", "No image data to display. Please load images first.")
                 return
             
-            prompt_count = sum(1 for stats in self.data_manager.image_stats.values() 
-                              if stats.get('prompt'))
+            prompt_count = self.data_manager.prompt_count
             
             if prompt_count == 0:
                 messagebox.showinfo("No Prompts", "No AI generation prompts found in the images. "
                                   "Prompt analysis requires images with embedded prompt metadata.")
                 return
             
-            print(f"MainWindow: Found {prompt_count} images with prompts")
+            log.debug("Found %s images with prompts", prompt_count)
+            
+            self._get_stats_window().show()
             
-            if self.stats_window is None:
-                print("MainWindow: Creating new stats window for prompt analysis...")
-                self.stats_window = StatsWindow(
-                    self.root, 
-                    self.data_manager, 
-                    self.ranking_algorithm, 
-                    self.prompt_analyzer
-                )
-                print("MainWindow: Stats window created successfully")
-            else:
-                print("MainWindow: Showing existing stats window...")
-                self.stats_window.show()
-                
             # Focus on prompt analysis tab
-            if hasattr(self.stats_window, 'focus_prompt_analysis_tab'):
-                self.stats_window.focus_prompt_analysis_tab()
+            self.stats_window.focus_prompt_analysis_tab()
         except Exception as e:
             error_msg = f"Error showing prompt analysis: {e}"
-            print(error_msg)
-            print(traceback.format_exc())
+            log.exception(error_msg)
             messagebox.showerror("Prompt Analysis Error", f"Failed to show prompt analysis:\n{str(e)}\n\nSee console for details.")
             # Reset the stats window in case it's corrupted
             self.stats_window = None
     
-    def show_settings(self) -> None:
+    def show_settings(self, event=None) -> None:
         """Show the settings window with error handling."""
         try:
             if self.settings_window is None:
+                from ui.settings_window import SettingsWindow
                 self.settings_window = SettingsWindow(self.root, self.data_manager)
-            else:
-                self.settings_window.show()
+            self.settings_window.show()
         except Exception as e:
             error_msg = f"Error showing settings window: {e}"
-            print(error_msg)
-            print(traceback.format_exc())
+            log.exception(error_msg)
             messagebox.showerror("Settings Error", f"Failed to show settings window:\n{str(e)}\n\nSee console for details.")
             # Reset the settings window in case it's corrupted
             self.settings_window = None
@@ -651,30 +823,49 @@ class MainWindow:
     def on_closing(self) -> None:
         """Handle application closing with cleanup and error handling."""
         try:
-            print("MainWindow: Cleaning up application...")
-            
-            self.metadata_processor.cleanup()
-            self.progress_tracker.cleanup()
-            self.folder_manager.cleanup()
-            self.voting_controller.cleanup()
-            self.image_display.cleanup()
-            
+            log.debug("Cleaning up application...")
+            
+            if self.stats_refresh_timer:
+                self.root.after_cancel(self.stats_refresh_timer)
+                self.stats_refresh_timer = None
+            
+            # Each step touches Tk widgets, so they run here in turn; a failing
+            # step is logged and the rest still run. The scan, metadata, decode and
+            # preview pools are shut down without waiting. An in-progress save
+            # keeps writing in the I/O thread meanwhile, and is waited for below.
+            cleanups = [
+                self.metadata_processor.cleanup,
+                self.progress_tracker.cleanup,
+                self.folder_manager.cleanup,
+            ]
+            if self.voting_controller:
+                cleanups.append(self.voting_controller.cleanup)
+            if self.image_display:
+                cleanups.append(self.image_display.cleanup)
             if self.stats_window:
-                self.stats_window.close_window()
+                cleanups.append(self.stats_window.close_window)
             if self.settings_window:
-                self.settings_window.close_window()
+                cleanups.append(self.settings_window.close_window)
+            cleanups.append(self.image_processor.cleanup_resources)
             
-            self.image_processor.cleanup_resources()
+            for cleanup in cleanups:
+                try:
+                    cleanup()
+                except Exception:
+                    log.exception("Error during cleanup step %s", cleanup.__qualname__)
             
-            print("MainWindow: Cleanup completed successfully")
+            # Let an in-progress save finish writing before exiting
+            self.io_executor.shutdown(wait=True)
             
-        except Exception as e:
-            print(f"MainWindow: Error during cleanup: {e}")
+            log.debug("Cleanup completed")
+            
+        except Exception:
+            log.exception("Error during cleanup")
             # Continue with shutdown even if cleanup fails
         
         try:
             self.root.destroy()
-        except Exception as e:
-            print(f"MainWindow: Error destroying root window: {e}")
+        except Exception:
+            log.exception("Error destroying root window")
             # Force exit if normal destroy fails
             sys.exit(0)
\ No newline at end of file
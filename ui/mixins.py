@@ -3,21 +3,40 @@
 import tkinter as tk
 from tkinter import ttk
 import os
-from config import Colors
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from config import Colors, Defaults
 
 
 class ImagePreviewMixin:
     """Mixin class for image preview functionality."""
     
+    # Set by the host class; the preview copes without them
+    data_manager = None
+    ranking_algorithm = None
+    
     def __init__(self):
         self.image_label = None
         self.image_info_label = None
         self.additional_stats_label = None
         self.prompt_text = None
-        self.current_image = None
         self.current_displayed_image = None
+        self.current_preview_size = None  # Size current_displayed_image was shown at
         self.resize_timer = None
+        self.last_window_size = None
+        self.hover_timer = None
+        self.pending_preview = None
         self.image_processor = None
+        self.preview_window = None  # Host's window, set by setup_preview_resize_handling()
+        # (path, mtime, width, height) -> PhotoImage, least recently shown first
+        self._preview_cache = OrderedDict()
+        # Same keys -> future of a PIL image decoded by prefetch_preview()
+        self._preview_futures = {}
+        self._preview_executor = None  # Started on first prefetch
+        # filename -> (tier_history list, its length, stability computed from it)
+        self._stability_cache = {}
+        # widget -> text it currently shows, so unchanged text is not re-rendered
+        self._shown_texts = {}
         
     def create_image_preview_area(self, parent, include_additional_stats=True):
         """Create the image preview area layout."""
@@ -39,6 +58,7 @@ class ImagePreviewMixin:
         self.image_label = tk.Label(preview_frame, text="Hover over an image\nto preview", 
                                    bg=Colors.BG_TERTIARY, fg=Colors.TEXT_SECONDARY,
                                    font=('Arial', 12), justify=tk.CENTER)
+        self.image_label.image = None  # Keeps the shown PhotoImage alive
         self.image_label.grid(row=row, column=0, sticky="nsew", padx=10, pady=5)
         preview_frame.grid_rowconfigure(row, weight=1, minsize=400)
         row += 1
@@ -86,38 +106,41 @@ class ImagePreviewMixin:
     
     def display_preview_image(self, filename):
         """Display a preview image."""
-        if not filename or not hasattr(self, 'data_manager') or not self.data_manager.image_folder:
+        if not filename or self.data_manager is None or not self.data_manager.image_folder:
             return
         
         try:
-            img_path = os.path.join(self.data_manager.image_folder, filename)
-            if not os.path.exists(img_path):
-                return
-            
-            if hasattr(self, 'window'):
-                self.window.update_idletasks()
-            else:
-                self.root.update_idletasks()
-            
-            label_width = self.image_label.winfo_width()
-            label_height = self.image_label.winfo_height()
-            
-            if label_width <= 1 or label_height <= 1:
-                window_ref = self.window if hasattr(self, 'window') else self.root
+            window_ref = self.preview_window
+            size = self._get_preview_size()
+            if size is None:
+                # Only needed before the label is first laid out; after that
+                # resizes are picked up by on_preview_window_resize()
+                window_ref.update_idletasks()
+                size = self._get_preview_size()
+            if size is None:
                 window_ref.after(100, lambda: self.display_preview_image(filename))
                 return
             
-            preview_width = max(label_width - 10, 300)
-            preview_height = max(label_height - 10, 300)
+            if filename == self.current_displayed_image and size == self.current_preview_size:
+                # Already on screen at this size; only the stats may have changed
+                self.update_image_info_display(filename)
+                return
             
-            photo = self.image_processor.load_and_resize_image(
-                img_path, preview_width, preview_height)
+            img_path = os.path.join(self.data_manager.image_folder, filename)
+            try:
+                # The cache key's mtime lookup doubles as the existence check
+                photo = self._get_preview_photo(img_path, *size)
+            except FileNotFoundError:
+                return
             
             if photo:
-                self.current_image = None
-                self.image_label.config(image=photo, text="")
-                self.current_image = photo
+                # Cached previews come back as the same PhotoImage, so the
+                # label is only reconfigured when the image really changes
+                if photo is not self.image_label.image:
+                    self.image_label.config(image=photo, text="")
+                    self.image_label.image = photo
                 self.current_displayed_image = filename
+                self.current_preview_size = size
                 self.update_image_info_display(filename)
             else:
                 self.handle_image_load_error(filename)
@@ -126,9 +149,102 @@ class ImagePreviewMixin:
             print(f"Error displaying preview for {filename}: {e}")
             self.handle_image_load_error(filename)
     
+    def schedule_preview(self, filename):
+        """Show a preview once the hover has settled on filename."""
+        if filename == self.pending_preview:
+            return
+        
+        window_ref = self.preview_window
+        self.cancel_scheduled_preview()
+        # Decode while the hover settles
+        self.prefetch_preview(filename)
+        self.pending_preview = filename
+        self.hover_timer = window_ref.after(
+            Defaults.PREVIEW_HOVER_DELAY_MS, self._show_scheduled_preview)
+    
+    def cancel_scheduled_preview(self):
+        """Drop a preview that has been scheduled but not shown yet."""
+        if self.hover_timer:
+            window_ref = self.preview_window
+            try:
+                window_ref.after_cancel(self.hover_timer)
+            except (tk.TclError, AttributeError):
+                pass
+            self.hover_timer = None
+        self.pending_preview = None
+    
+    def _show_scheduled_preview(self):
+        """Timer callback for schedule_preview()."""
+        filename = self.pending_preview
+        self.hover_timer = None
+        self.pending_preview = None
+        self.display_preview_image(filename)
+    
+    def _get_preview_size(self):
+        """Return the size previews are scaled to, or None before the label is laid out."""
+        label_width = self.image_label.winfo_width()
+        label_height = self.image_label.winfo_height()
+        if label_width <= 1 or label_height <= 1:
+            return None
+        
+        preview_width = max(label_width - 10, 300)
+        preview_height = max(label_height - 10, 300)
+        step = Defaults.PREVIEW_SIZE_STEP
+        return preview_width - preview_width % step, preview_height - preview_height % step
+    
+    def prefetch_preview(self, filename):
+        """Start decoding a preview in a worker thread so showing it later is quick."""
+        if (not filename or not self.image_label or not self.image_processor
+                or self.data_manager is None or not self.data_manager.image_folder):
+            return
+        
+        size = self._get_preview_size()
+        if size is None:
+            return
+        
+        img_path = os.path.join(self.data_manager.image_folder, filename)
+        try:
+            key = (img_path, os.path.getmtime(img_path)) + size
+        except OSError:
+            return
+        if key in self._preview_cache or key in self._preview_futures:
+            return
+        
+        if self._preview_executor is None:
+            self._preview_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preview")
+        self._preview_futures[key] = self._preview_executor.submit(
+            self.image_processor.open_resized_image, img_path, *size)
+        
+        # Drop the oldest prefetch once the mouse has moved on past many rows
+        if len(self._preview_futures) > Defaults.PREVIEW_CACHE_SIZE:
+            oldest = next(iter(self._preview_futures))
+            self._preview_futures.pop(oldest).cancel()
+    
+    def _get_preview_photo(self, img_path, width, height):
+        """Return a resized preview, decoding the file only if no cached copy matches."""
+        key = (img_path, os.path.getmtime(img_path), width, height)
+        cache = self._preview_cache
+        photo = cache.get(key)
+        if photo is not None:
+            cache.move_to_end(key)
+            return photo
+        
+        future = self._preview_futures.pop(key, None)
+        if future is not None:
+            # Decoded by prefetch_preview(); only waits if still running
+            img = future.result()
+            photo = self.image_processor.to_photo_image(img) if img is not None else None
+        else:
+            photo = self.image_processor.load_and_resize_image(img_path, width, height)
+        if photo:
+            cache[key] = photo
+            if len(cache) > Defaults.PREVIEW_CACHE_SIZE:
+                cache.popitem(last=False)
+        return photo
+    
     def update_image_info_display(self, filename):
         """Update the image info and stats displays."""
-        if not hasattr(self, 'data_manager'):
+        if self.data_manager is None:
             return
             
         stats = self.data_manager.get_image_stats(filename)
@@ -140,57 +256,87 @@ class ImagePreviewMixin:
         info_text = (f"{filename}\n"
                     f"Tier: {stats.get('current_tier', 0)} | "
                     f"Votes: {votes}")
-        self.image_info_label.config(text=info_text)
+        self._set_label_text(self.image_info_label, info_text)
         
-        if hasattr(self, 'additional_stats_label') and self.additional_stats_label:
+        if self.additional_stats_label:
             stability = 0
-            if hasattr(self, 'ranking_algorithm'):
-                stability = self.ranking_algorithm._calculate_tier_stability(filename)
+            if self.ranking_algorithm is not None:
+                stability = self._get_tier_stability(filename, stats)
             
             additional_text = (f"Win Rate: {win_rate:.1%} ({wins}/{votes})\n"
                              f"Stability: {stability:.2f} | "
                              f"Last voted: {stats.get('last_voted', 'Never')}")
-            self.additional_stats_label.config(text=additional_text)
+            self._set_label_text(self.additional_stats_label, additional_text)
         
         if self.prompt_text:
             prompt = stats.get('prompt', '')
-            self.prompt_text.config(state=tk.NORMAL)
-            self.prompt_text.delete(1.0, tk.END)
-            if prompt:
-                self.prompt_text.insert(1.0, prompt)
-            else:
-                self.prompt_text.insert(1.0, "No prompt information available")
-            self.prompt_text.config(state=tk.DISABLED)
+            self._set_prompt_text(prompt or "No prompt information available")
+    
+    def _set_label_text(self, label, text):
+        """Set a preview label's text unless it already shows it."""
+        if self._shown_texts.get(label) != text:
+            label.config(text=text)
+            self._shown_texts[label] = text
+    
+    def _set_prompt_text(self, text):
+        """Replace the prompt box contents unless they already match."""
+        if self._shown_texts.get(self.prompt_text) == text:
+            return
+        self.prompt_text.config(state=tk.NORMAL)
+        self.prompt_text.replace(1.0, tk.END, text)
+        self.prompt_text.config(state=tk.DISABLED)
+        self._shown_texts[self.prompt_text] = text
+    
+    def _get_tier_stability(self, filename, stats):
+        """Return the tier stability for filename, recomputed only after its history changes."""
+        # Votes append to tier_history and purging replaces it, so the list
+        # object and its length identify the history the value came from
+        history = stats.get('tier_history')
+        cached = self._stability_cache.get(filename)
+        if cached is not None and cached[0] is history and cached[1] == len(history):
+            return cached[2]
+        
+        stability = self.ranking_algorithm._calculate_tier_stability(filename)
+        if history is not None:
+            self._stability_cache[filename] = (history, len(history), stability)
+        return stability
     
     def handle_image_load_error(self, filename):
         """Handle image loading errors."""
         if self.image_label:
             self.image_label.config(image="", text="Failed to load image")
+            self.image_label.image = None
         
         if self.image_info_label:
-            self.image_info_label.config(text=f"Error loading: {filename}")
+            self._set_label_text(self.image_info_label, f"Error loading: {filename}")
         
-        if hasattr(self, 'additional_stats_label') and self.additional_stats_label:
-            self.additional_stats_label.config(text="")
+        if self.additional_stats_label:
+            self._set_label_text(self.additional_stats_label, "")
         
         if self.prompt_text:
-            self.prompt_text.config(state=tk.NORMAL)
-            self.prompt_text.delete(1.0, tk.END)
-            self.prompt_text.insert(1.0, "Error loading image")
-            self.prompt_text.config(state=tk.DISABLED)
+            self._set_prompt_text("Error loading image")
         
-        self.current_image = None
+        self.current_preview_size = None
     
     def setup_preview_resize_handling(self):
         """Set up resize event handling for the preview area."""
-        window_ref = self.window if hasattr(self, 'window') else self.root
-        if window_ref:
-            window_ref.bind('<Configure>', self.on_preview_window_resize)
+        self.last_window_size = None
+        # Looked up once here; the host's window attribute does not change
+        # until the window is rebuilt, which calls this again
+        self.preview_window = self.window if hasattr(self, 'window') else self.root
+        if self.preview_window:
+            self.preview_window.bind('<Configure>', self.on_preview_window_resize)
     
     def on_preview_window_resize(self, event):
         """Handle window resize events with debouncing."""
-        window_ref = self.window if hasattr(self, 'window') else self.root
-        if window_ref and event.widget == window_ref:
+        window_ref = self.preview_window
+        if window_ref and event.widget is window_ref:
+            # Moves and focus changes also send <Configure>; only a new size needs a refresh
+            size = (event.width, event.height)
+            if size == self.last_window_size:
+                return
+            self.last_window_size = size
+            
             if self.resize_timer:
                 window_ref.after_cancel(self.resize_timer)
             
@@ -204,24 +350,37 @@ class ImagePreviewMixin:
     def cleanup_preview_resources(self):
         """Clean up preview-related resources."""
         if self.resize_timer:
-            window_ref = self.window if hasattr(self, 'window') else self.root
-            if window_ref and hasattr(window_ref, 'after_cancel'):
+            window_ref = self.preview_window
+            if window_ref is not None:
                 try:
                     window_ref.after_cancel(self.resize_timer)
                 except (tk.TclError, AttributeError):
                     pass
             self.resize_timer = None
         
-        self.current_image = None
+        self.cancel_scheduled_preview()
+        self.preview_window = None
         self.current_displayed_image = None
+        self.current_preview_size = None
+        self._preview_cache.clear()
+        self._stability_cache.clear()
+        self._shown_texts.clear()
+        
+        for future in self._preview_futures.values():
+            future.cancel()
+        self._preview_futures.clear()
+        if self._preview_executor is not None:
+            self._preview_executor.shutdown(wait=False, cancel_futures=True)
+            self._preview_executor = None
         
         if self.image_label:
             try:
                 self.image_label.config(image="")
+                self.image_label.image = None
             except (tk.TclError, AttributeError):
                 pass
         
-        if hasattr(self, 'prompt_text') and self.prompt_text:
+        if self.prompt_text:
             try:
                 self.prompt_text.config(state=tk.NORMAL)
                 self.prompt_text.delete(1.0, tk.END)
@@ -238,10 +397,10 @@ class ImagePreviewMixin:
     def bind_hover_for_preview(self, widget, image_filename):
         """Bind hover events to show image preview."""
         def on_enter(event):
-            self.display_preview_image(image_filename)
+            self.schedule_preview(image_filename)
         
         def on_leave(event):
-            pass
+            self.cancel_scheduled_preview()
         
         try:
             widget.bind("<Enter>", on_enter)
@@ -39,12 +39,18 @@ class SettingsWindow:
         self._cutline_preview_label   = None
     
     def show(self):
-        """Show the settings window."""
+        """Show the settings window, reusing the widgets from an earlier opening."""
         if self.window is None or not self.window.winfo_exists():
             self.create_window()
-        else:
-            self.window.lift()
-            self.window.focus_force()
+            return
+        
+        if self.window.state() == 'withdrawn':
+            # Edits made without Apply are dropped, as with a fresh window
+            self.load_current_settings()
+            self.update_all_displays()
+            self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
     
     def create_window(self):
         """Create the settings window."""
@@ -382,6 +388,17 @@ Tier Analysis:"""
         self.update_overflow_threshold_display()
         self.update_min_overflow_images_display()
     
+    def load_current_settings(self):
+        """Reset the setting controls to the values currently in use."""
+        s = self.data_manager.algorithm_settings
+        self.tier_std_var.set(s.tier_distribution_std)
+        self.overflow_threshold_var.set(s.overflow_threshold)
+        self.min_overflow_images_var.set(s.min_overflow_images)
+        self._target_count_var.set(s.target_count)
+        self._cutline_buffer_var.set(s.cutline_buffer_tiers)
+        self._zone_base_votes_var.set(s.zone_base_votes)
+        self._zone_votes_per_tier_var.set(s.zone_votes_per_tier)
+    
     def update_all_displays(self):
         """Update all setting displays."""
         self.update_tier_std_display()
@@ -414,6 +431,7 @@ Tier Analysis:"""
         if self._zone_votes_per_tier_var is not None:
             self.data_manager.algorithm_settings.set_value(
                 'zone_votes_per_tier', round(float(self._zone_votes_per_tier_var.get()), 2))
+        self.data_manager.mark_modified()
 
         messagebox.showinfo("Success",
             "Settings updated successfully!\n\n"
@@ -618,8 +636,8 @@ Tier Analysis:"""
                               textvariable=self._target_count_var, width=10,
                               command=self.update_cutline_preview_display)
         tc_entry.pack(side=tk.LEFT, padx=5)
-        tc_entry.bind('<FocusOut>', lambda e: self.update_cutline_preview_display())
-        tc_entry.bind('<Return>',   lambda e: self.update_cutline_preview_display())
+        tc_entry.bind('<FocusOut>', self.update_cutline_preview_display)
+        tc_entry.bind('<Return>',   self.update_cutline_preview_display)
 
         # --- Buffer tiers ---
         row2 = tk.Frame(section, bg=Colors.BG_SECONDARY)
@@ -656,7 +674,7 @@ Tier Analysis:"""
         self._zone_votes_per_tier_var = tk.DoubleVar(value=s.zone_votes_per_tier)
         tk.Scale(row4, from_=0.0, to=5.0, resolution=0.1, orient=tk.HORIZONTAL,
                  variable=self._zone_votes_per_tier_var, length=200,
-                 command=lambda v: self.update_cutline_preview_display(),
+                 command=self.update_cutline_preview_display,
                  bg=Colors.BG_SECONDARY, fg=Colors.TEXT_PRIMARY,
                  troughcolor=Colors.BG_TERTIARY).pack(side=tk.LEFT, padx=5)
 
@@ -669,7 +687,7 @@ Tier Analysis:"""
 
         self.update_cutline_preview_display()
 
-    def update_cutline_preview_display(self):
+    def update_cutline_preview_display(self, event=None):
         """Refresh the live cutline preview label."""
         if self._cutline_preview_label is None:
             return
@@ -733,7 +751,6 @@ Tier Analysis:"""
             fg=Colors.TEXT_SUCCESS if tc <= n else Colors.TEXT_WARNING)
 
     def close_window(self):
-        """Handle window closing."""
-        if self.window:
-            self.window.destroy()
-            self.window = None
+        """Hide the window; show() brings it back without rebuilding it."""
+        if self.window and self.window.winfo_exists():
+            self.window.withdraw()
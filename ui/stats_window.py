@@ -3,6 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 import os
+import logging
 
 from config import Colors
 from ui.mixins import ImagePreviewMixin
@@ -12,6 +13,8 @@ from ui.components.prompt_analyzer_ui import PromptAnalyzerUI
 from ui.components.word_combination_analyzer_ui import WordCombinationAnalyzerUI
 from ui.components.stats_table import StatsTable
 
+log = logging.getLogger(__name__)
+
 
 class StatsWindow(ImagePreviewMixin):
     """Window for displaying detailed statistics about the ranking system with combination analysis."""
@@ -25,23 +28,54 @@ class StatsWindow(ImagePreviewMixin):
         self.prompt_analyzer = prompt_analyzer
         self.window = None
         self.notebook = None
+        self.needs_refresh = False  # Set when refreshes were skipped while minimized
         
-        self.chart_generator = ChartGenerator(data_manager)
-        self.data_exporter = DataExporter(data_manager, prompt_analyzer, ranking_algorithm)
-        self.stats_table = StatsTable(data_manager, ranking_algorithm, prompt_analyzer)
-        self.prompt_analyzer_ui = PromptAnalyzerUI(data_manager, prompt_analyzer)
+        # Components are built on first show()
+        self._built = False
+        self.chart_generator = None
+        self.data_exporter = None
+        self.stats_table = None
+        self.prompt_analyzer_ui = None
         self.word_combination_ui = None  # Will be created if needed
     
+    def _build_components(self):
+        """Create the chart, table, export and analysis helpers."""
+        self.chart_generator = ChartGenerator(self.data_manager)
+        self.data_exporter = DataExporter(self.data_manager, self.prompt_analyzer, self.ranking_algorithm)
+        self.stats_table = StatsTable(self.data_manager, self.ranking_algorithm, self.prompt_analyzer)
+        self.prompt_analyzer_ui = PromptAnalyzerUI(self.data_manager, self.prompt_analyzer)
+        self._built = True
+    
     def show(self):
         """Show the statistics window."""
+        if not self._built:
+            self._build_components()
+        
         if self.window is None or not self.window.winfo_exists():
             self.create_window()
         else:
             self.window.lift()
             self.window.focus_force()
     
+    def is_visible(self):
+        """Return True if the window exists and is not withdrawn or minimized."""
+        try:
+            return (self.window is not None and self.window.winfo_exists()
+                    and self.window.state() not in ('withdrawn', 'iconic'))
+        except tk.TclError:
+            return False
+    
+    def _on_window_mapped(self, event):
+        """Catch up on refreshes skipped while the window was minimized."""
+        if event.widget is self.window and self.needs_refresh:
+            self.needs_refresh = False
+            self.refresh_stats()
+    
     def focus_prompt_analysis_tab(self):
         """Focus on the prompt analysis tab."""
+        if self.window is None:
+            self.show()
+        
         if self.notebook:
             for i in range(self.notebook.index("end")):
                 if "Prompt Analysis" in self.notebook.tab(i, "text"):
@@ -51,8 +85,10 @@ class StatsWindow(ImagePreviewMixin):
     def create_window(self):
         """Create the statistics window."""
         try:
-            from core.image_processor import ImageProcessor
-            self.image_processor = ImageProcessor()
+            # Reopening the window reuses the preview image processor
+            if self.image_processor is None:
+                from core.image_processor import ImageProcessor
+                self.image_processor = ImageProcessor()
             
             self.window = tk.Toplevel(self.parent)
             self.window.title("Detailed Statistics & Analysis")
@@ -61,6 +97,8 @@ class StatsWindow(ImagePreviewMixin):
             self.window.configure(bg=Colors.BG_PRIMARY)
             
             self.window.protocol("WM_DELETE_WINDOW", self.close_window)
+            self.window.bind('<Map>', self._on_window_mapped)
+            self.needs_refresh = False  # A new window starts from current data
             
             self.setup_preview_resize_handling()
             
@@ -79,17 +117,15 @@ class StatsWindow(ImagePreviewMixin):
             
             self.create_main_stats_tab(self.notebook)
             
-            prompt_count = sum(1 for stats in self.data_manager.image_stats.values() 
-                              if stats.get('prompt'))
+            prompt_count = self.data_manager.prompt_count
             if prompt_count > 0:
                 self.create_prompt_analysis_tab(self.notebook)
             
             print("Stats window created and populated successfully with combination analysis")
             
         except Exception as e:
-            print(f"Error creating stats window: {e}")
-            import traceback
-            print(traceback.format_exc())
+            # The caller reports the full traceback
+            log.error("Error creating stats window: %s", e)
             raise
     
     def create_main_stats_tab(self, notebook: ttk.Notebook):
@@ -141,8 +177,8 @@ class StatsWindow(ImagePreviewMixin):
             # Create stats table with error handling
             try:
                 self.stats_table.create_stats_table(frame)
-                self.stats_table.set_hover_callback(self.display_preview_image)
-                self.stats_table.set_leave_callback(lambda: None)
+                self.stats_table.set_hover_callback(self.schedule_preview)
+                self.stats_table.set_leave_callback(self.cancel_scheduled_preview)
             except Exception as e:
                 print(f"Error creating stats table: {e}")
                 # Create error label instead of crashing
@@ -176,8 +212,8 @@ class StatsWindow(ImagePreviewMixin):
             self.prompt_analyzer_ui.create_prompt_analysis_tab(word_frame)
             
             # Set up individual word analysis callbacks
-            self.prompt_analyzer_ui.set_hover_callback(self.display_preview_image)
-            self.prompt_analyzer_ui.set_leave_callback(lambda: None)
+            self.prompt_analyzer_ui.set_hover_callback(self.schedule_preview)
+            self.prompt_analyzer_ui.set_leave_callback(self.cancel_scheduled_preview)
             self.prompt_analyzer_ui.set_export_callback(self.export_word_analysis)
             
             # Word combination analysis tab
@@ -190,8 +226,8 @@ class StatsWindow(ImagePreviewMixin):
                 self.word_combination_ui.create_combination_analysis_tab(combination_frame)
                 
                 # Set up combination analysis callbacks
-                self.word_combination_ui.set_hover_callback(self.display_preview_image)
-                self.word_combination_ui.set_leave_callback(lambda: None)
+                self.word_combination_ui.set_hover_callback(self.schedule_preview)
+                self.word_combination_ui.set_leave_callback(self.cancel_scheduled_preview)
                 self.word_combination_ui.set_export_callback(self.export_combination_analysis)
                 
                 print("Word combination analysis tab created successfully")
@@ -234,10 +270,10 @@ class StatsWindow(ImagePreviewMixin):
     def refresh_stats(self):
         """Refresh all statistics displays including combination analysis."""
         try:
-            if hasattr(self, 'stats_table') and self.stats_table:
+            if self.stats_table:
                 self.stats_table.refresh_table()
             
-            if hasattr(self, 'chart_generator') and self.chart_generator:
+            if self.chart_generator:
                 # Find and refresh charts
                 if self.window and self.window.winfo_exists():
                     for widget in self.window.winfo_children():
@@ -258,10 +294,10 @@ class StatsWindow(ImagePreviewMixin):
                                         except Exception as tab_error:
                                             print(f"Error refreshing tab: {tab_error}")
             
-            if hasattr(self, 'prompt_analyzer_ui') and self.prompt_analyzer_ui:
+            if self.prompt_analyzer_ui:
                 self.prompt_analyzer_ui.refresh_analysis()
             
-            if hasattr(self, 'word_combination_ui') and self.word_combination_ui:
+            if self.word_combination_ui:
                 self.word_combination_ui.refresh_combination_analysis()
                 
         except Exception as e:
@@ -272,9 +308,9 @@ class StatsWindow(ImagePreviewMixin):
         try:
             summary = {
                 'overall_stats': self.data_manager.get_overall_statistics(),
-                'chart_data': self.chart_generator.get_chart_data_summary() if hasattr(self, 'chart_generator') else {},
-                'table_stats': self.stats_table.get_table_stats() if hasattr(self, 'stats_table') else {},
-                'prompt_analysis': self.prompt_analyzer_ui.get_analysis_summary() if hasattr(self, 'prompt_analyzer_ui') else {},
+                'chart_data': self.chart_generator.get_chart_data_summary() if self.chart_generator else {},
+                'table_stats': self.stats_table.get_table_stats() if self.stats_table else {},
+                'prompt_analysis': self.prompt_analyzer_ui.get_analysis_summary() if self.prompt_analyzer_ui else {},
                 'combination_analysis': self.word_combination_ui.get_analysis_summary() if hasattr(self, 'word_combination_ui') and self.word_combination_ui else {}
             }
             return summary
@@ -285,20 +321,18 @@ class StatsWindow(ImagePreviewMixin):
     def export_all_data(self):
         """Export all available data including combination analysis."""
         try:
-            if hasattr(self, 'data_exporter'):
+            if self.data_exporter:
                 export_options = self.data_exporter.get_export_options()
                 
                 dialog = tk.Toplevel(self.window)
                 dialog.title("Export Data")
-                dialog.geometry("500x400")
-                dialog.configure(bg=Colors.BG_PRIMARY)
-                dialog.transient(self.window)
-                dialog.grab_set()
-                
-                dialog.geometry("+%d+%d" % (
+                dialog.geometry("500x400+%d+%d" % (
                     self.window.winfo_rootx() + 200,
                     self.window.winfo_rooty() + 200
                 ))
+                dialog.configure(bg=Colors.BG_PRIMARY)
+                dialog.transient(self.window)
+                dialog.grab_set()
                 
                 tk.Label(dialog, text="Select Export Type", 
                         font=('Arial', 14, 'bold'), fg=Colors.TEXT_PRIMARY, 
@@ -343,16 +377,16 @@ class StatsWindow(ImagePreviewMixin):
     def close_window(self):
         """Handle window closing with cleanup including combination analysis."""
         try:
-            if hasattr(self, 'chart_generator'):
+            if self.chart_generator:
                 self.chart_generator.cleanup_chart()
             
-            if hasattr(self, 'stats_table'):
+            if self.stats_table:
                 self.stats_table.cleanup()
             
-            if hasattr(self, 'prompt_analyzer_ui'):
+            if self.prompt_analyzer_ui:
                 self.prompt_analyzer_ui.cleanup()
             
-            if hasattr(self, 'word_combination_ui') and self.word_combination_ui:
+            if self.word_combination_ui:
                 self.word_combination_ui.cleanup()
             
             self.cleanup_preview_resources()